@@ -30,40 +30,183 @@ import pythoncom
 import win32com.client as win32
 import math
 import numpy as np
-from scipy.signal import butter, filtfilt
-from scipy.interpolate import InterpolatedUnivariateSpline
+from scipy.signal import butter, sosfiltfilt, firwin
+from scipy.ndimage import convolve1d
+from scipy.interpolate import splprep, splev
 import re
 import logging
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
 
 logger_name = 'pyc3dserver'
 logger = logging.getLogger(logger_name)
 logger.setLevel('CRITICAL')
 logger.addHandler(logging.NullHandler())
 
-def filt_bw_bp(data, fc_low, fc_high, fs, order=2):
-    nyq = 0.5 * fs
-    low = fc_low / nyq
-    high = fc_high / nyq
-    b, a = butter(order, [low, high], analog=False, btype='bandpass', output='ba')
+_itf_cache = {}
+_itf_marker_batches = {}
+
+def _get_itf_cache(itf):
+    key = id(itf)
+    cache = _itf_cache.get(key, None)
+    if cache is None:
+        cache = _itf_cache[key] = {}
+        try:
+            weakref.finalize(itf, _itf_cache.pop, key, None)
+        except TypeError:
+            pass
+    return cache
+
+def _get_cached(itf, key, func):
+    cache = _get_itf_cache(itf)
+    if key not in cache:
+        cache[key] = func()
+    return cache[key]
+
+def _drop_cached(itf, key):
+    cache = _itf_cache.get(id(itf), None)
+    if cache is not None:
+        cache.pop(key, None)
+
+def _get_param_index(itf, grp_name, par_name):
+    return _get_cached(itf, ('par_idx', grp_name, par_name), lambda: itf.GetParameterIndex(grp_name, par_name))
+
+def _get_param_values(itf, grp_name, par_name):
+    # every item of a parameter in one pass, kept until the file or its parameters change
+    def fetch():
+        par_idx = _get_param_index(itf, grp_name, par_name)
+        if par_idx == -1:
+            return ()
+        get_par_val = itf.GetParameterValue
+        return tuple(get_par_val(par_idx, i) for i in range(itf.GetParameterLength(par_idx)))
+    return _get_cached(itf, ('par_vals', grp_name, par_name), fetch)
+
+def _resolve_param(itf, grp_name, par_name, log=False):
+    par_idx = _get_param_index(itf, grp_name, par_name)
+    if par_idx == -1:
+        if log: logger.warning('%s:%s does not exist', grp_name, par_name)
+        return None, None
+    n_items = itf.GetParameterLength(par_idx)
+    if n_items < 1:
+        if log: logger.warning('No item under %s:%s', grp_name, par_name)
+        return None, None
+    return par_idx, n_items
+
+def _clear_itf_cache(itf):
+    cache = _itf_cache.get(id(itf), None)
+    if cache is not None:
+        cache.clear()
+
+def _com_to_array(com_values, dtype, count):
+    # pywin32 returns a SAFEARRAY as a tuple of Python scalars; buffer-protocol objects are viewed by np.asarray in their own format
+    if isinstance(com_values, (tuple, list)):
+        return np.fromiter(com_values, dtype=dtype, count=count)
+    arr = np.asarray(com_values, dtype=dtype)
+    if arr.shape != (count,):
+        err_msg = f'Expected {count} values from the COM call, but got an array of shape {arr.shape}'
+        raise ValueError(err_msg)
+    return arr
+
+def _finalize_marker_pos(mkr_data, scale_size=None, mkr_resid=None):
+    # scale and blank out blocked frames in place on the (n_frs, 3) buffer
+    if scale_size is not None:
+        mkr_data *= scale_size
+    if mkr_resid is not None:
+        np.copyto(mkr_data, np.nan, where=np.equal(mkr_resid, -1).reshape(-1, 1))
+    return mkr_data
+
+def _fetch_and_scale_analog(get_anl_data, sig_idx, start_fr, end_fr, n_sig_samples, sig_offset, sig_scale, out=None):
+    # unscaled samples from a bound GetAnalogDataEx, offset-corrected and scaled in place (in 'out' if given)
+    com_values = get_anl_data(sig_idx, start_fr, end_fr, '0', 0, 0, '0')
+    if out is None:
+        sig = _com_to_array(com_values, np.float32, n_sig_samples)
+    else:
+        sig = out
+        sig[:] = com_values
+    np.subtract(sig, sig_offset, out=sig)
+    np.multiply(sig, sig_scale, out=sig)
+    return sig
+
+def _to_str_array(strs):
+    # size the fixed-width unicode dtype in one pass instead of letting NumPy discover it
+    str_len = max(map(len, strs), default=1)
+    return np.asarray(strs, dtype='<U%d' % max(str_len, 1))
+
+def _norm_cutoffs(fs, *fcs):
+    # cut-off frequencies (scalars, lists or arrays) divided by the Nyquist rate, as a hashable tuple for the cached designers
+    inv_nyq = 2.0 / fs
+    return tuple(fc*inv_nyq for fc in np.concatenate([np.atleast_1d(np.asarray(fc, dtype=np.float64)).ravel() for fc in fcs]).tolist())
+
+@lru_cache(maxsize=64)
+def _design_butter(order, wn, btype):
+    # Butterworth second-order sections per (order, normalized cut-off(s), type), shared between calls and never modified
+    return butter(order, wn[0] if len(wn) == 1 else wn, analog=False, btype=btype, output='sos')
+
+@lru_cache(maxsize=64)
+def _design_fir_lp(numtaps, wn):
+    # windowed-sinc low-pass taps per (number of taps, normalized cut-off), shared between calls and never modified
+    return firwin(numtaps, wn[0] if len(wn) == 1 else wn)
+
+def _sosfiltfilt(sos, data):
+    # zero-phase filtering padded like filtfilt() with its default padlen on the equivalent (b, a) coefficients
+    n_zeros = min(np.count_nonzero(sos[:,2]==0), np.count_nonzero(sos[:,5]==0))
     axis = -1 if len(data.shape)==1 else 0
-    y = filtfilt(b, a, data, axis, padtype='odd', padlen=3*(max(len(b),len(a))-1))
+    return sosfiltfilt(sos, data, axis, padtype='odd', padlen=3*(2*sos.shape[0]+1-n_zeros))
+
+def filt_bw_bp(data, fc_low, fc_high, fs, order=2):
+    sos = _design_butter(order, _norm_cutoffs(fs, fc_low, fc_high), 'bandpass')
+    y = _sosfiltfilt(sos, data)
     return y
 
 def filt_bw_bs(data, fc_low, fc_high, fs, order=2):
-    nyq = 0.5 * fs
-    low = fc_low / nyq
-    high = fc_high / nyq
-    b, a = butter(order, [low, high], analog=False, btype='bandstop', output='ba')
-    axis = -1 if len(data.shape)==1 else 0
-    y = filtfilt(b, a, data, axis, padtype='odd', padlen=3*(max(len(b),len(a))-1))
+    sos = _design_butter(order, _norm_cutoffs(fs, fc_low, fc_high), 'bandstop')
+    y = _sosfiltfilt(sos, data)
     return y
 
 def filt_bw_lp(data, fc_low, fs, order=2):
-    nyq = 0.5 * fs
-    low = fc_low / nyq
-    b, a = butter(order, low, analog=False, btype='lowpass', output='ba')
+    sos = _design_butter(order, _norm_cutoffs(fs, fc_low), 'lowpass')
+    y = _sosfiltfilt(sos, data)
+    return y
+
+def filt_fir_lp(data, fc_low, fs, numtaps=None):
+    """
+    Apply a zero-lag low-pass FIR filter.
+
+    Parameters
+    ----------
+    data : numpy array
+        1D array (n,) or 2D array (n, m) to filter. A 2D array is filtered along the first axis.
+    fc_low : float
+        Cut-off frequency of the filter.
+    fs : float
+        Sampling frequency of the data.
+    numtaps : int or None, optional
+        Number of filter taps, which should be odd. If None, 2*ceil(fs/fc_low)+1 is used. The default is None.
+
+    Returns
+    -------
+    y : numpy array
+        Filtered array of the same shape as 'data'.
+
+    Notes
+    -----
+    The taps are designed by scipy.signal.firwin() and applied as one centered convolution by scipy.ndimage.convolve1d(),
+    extending the data at both ends with the nearest values.
+    This is a faster smoother than filt_bw_lp() for long or wide arrays, but its response is not identical to the zero-lag butterworth filter.
+
+    """
+    if numtaps is None:
+        numtaps = 2*int(math.ceil(fs/fc_low))+1
+    if numtaps%2 == 0:
+        err_msg = '"numtaps" should be odd for a zero-lag FIR filter'
+        raise ValueError(err_msg)
+    taps = _design_fir_lp(int(numtaps), _norm_cutoffs(fs, fc_low))
+    data = np.asarray(data)
+    if data.dtype.kind not in 'fc':
+        data = data.astype(np.float64)
     axis = -1 if len(data.shape)==1 else 0
-    y = filtfilt(b, a, data, axis, padtype='odd', padlen=3*(max(len(b),len(a))-1))
+    y = convolve1d(data, taps, axis=axis, mode='nearest')
     return y
 
 def init_logger(logger_lvl='WARNING', c_hdlr_lvl='WARNING', f_hdlr_lvl='ERROR', f_hdlr_f_mode='w', f_hdlr_f_path=None):
@@ -121,7 +264,7 @@ def reset_logger():
     logger.setLevel('CRITICAL')       
     return None
 
-def c3dserver(msg=True, log=False):
+def c3dserver(msg=True, log=False, early_binding=False):
     """
     Initialize C3DServer COM interface using win32com.client.Dispatch().
     
@@ -133,7 +276,10 @@ def c3dserver(msg=True, log=False):
     msg : bool, optional
         Whether to show the information of C3Dserver. The default is True.
     log: bool, optional
-        Whether to write logs or not. The default is False.        
+        Whether to write logs or not. The default is False.
+    early_binding : bool, optional
+        Whether to use the early-bound interface from win32com.client.gencache.EnsureDispatch() or not. The default is False.
+        If the type library wrapper can not be generated, the late-bound interface is used instead.
 
     Returns
     -------
@@ -142,7 +288,15 @@ def c3dserver(msg=True, log=False):
 
     """
     try:
-        itf = win32.Dispatch('C3DServer.C3D')
+        if early_binding:
+            try:
+                itf = win32.gencache.EnsureDispatch('C3DServer.C3D')
+            except (pythoncom.com_error, AttributeError, TypeError, ImportError) as err:
+                if log: logger.warning('Unable to use the early-bound interface: %s', err)
+                itf = win32.Dispatch('C3DServer.C3D')
+        else:
+            itf = win32.Dispatch('C3DServer.C3D')
+        _clear_itf_cache(itf)
         reg_mode = itf.GetRegistrationMode()
         ver = itf.GetVersion()
         user_name = itf.GetRegUserName()
@@ -166,9 +320,9 @@ def c3dserver(msg=True, log=False):
                 logger.info('Evaluation C3Dserver')
             elif reg_mode == 2:
                 logger.info('Registered C3Dserver')        
-            logger.info(f'Version: {ver}')
-            logger.info(f'User: {user_name}')
-            logger.info(f'Organization: {user_org}')
+            logger.info('Version: %s', ver)
+            logger.info('User: %s', user_name)
+            logger.info('Organization: %s', user_org)
         return itf
     except pythoncom.com_error as err:
         if log: logger.error(err.strerror)
@@ -196,17 +350,18 @@ def open_c3d(itf, f_path, strict_param_check=False, log=False):
 
     """
     try:
-        if log: logger.debug(f'Opening the file: "{f_path}"')
+        if log: logger.debug('Opening the file: "%s"', f_path)
         if not os.path.exists(f_path):
             err_msg = 'File path does not exist'
             raise FileNotFoundError(err_msg)
+        _clear_itf_cache(itf)
         ret = itf.Open(f_path, 3)
         if strict_param_check:
             itf.SetStrictParameterChecking(1)
         else:
             itf.SetStrictParameterChecking(0)
         if ret == 0:
-            if log: logger.info(f'File is opened')
+            if log: logger.info('File is opened')
             return True
         else:
             err_msg = f'File can not be opened'
@@ -248,14 +403,15 @@ def save_c3d(itf, f_path='', f_type=-1, compress_param_blocks=False, log=False):
 
     """
     try:
-        if log: logger.debug(f'Saving the file: "{f_path}"')
+        if log: logger.debug('Saving the file: "%s"', f_path)
         if compress_param_blocks:
             itf.CompressParameterBlocks(1)
         else:
             itf.CompressParameterBlocks(0)
+        _clear_itf_cache(itf)
         ret = itf.SaveFile(f_path, f_type)
         if ret == 1:
-            if log: logger.info(f'File is saved')
+            if log: logger.info('File is saved')
             return True
         else:
             err_msg = f'File can not be saved'
@@ -286,9 +442,54 @@ def close_c3d(itf, log=False):
         None.
 
     """
-    if log: logger.info(f'File is closed')
+    if log: logger.info('File is closed')
+    _clear_itf_cache(itf)
     return itf.Close()
 
+def _prime_itf_cache(itf, log=False):
+    # read the header values and the marker/analog labels once, so the following accessors are served from the cache
+    get_first_frame(itf, log=log)
+    get_last_frame(itf, log=log)
+    get_video_fps(itf, log=log)
+    get_analog_video_ratio(itf, log=log)
+    _get_point_labels(itf, log=log)
+    _get_analog_labels(itf, log=log)
+    _get_c3d_float_flag(itf, log=log)
+
+@contextmanager
+def c3d_file(itf, f_path, strict_param_check=False, log=False):
+    """
+    Open a C3D file for the duration of a 'with' block.
+
+    Parameters
+    ----------
+    itf : win32com.client.CDispatch
+        COM object of the C3Dserver.
+    f_path : str
+        Path of the input C3D file to open.
+    strict_param_check: bool, optional
+        Whether to enable strict parameter checking or not. The deafult is False.
+    log: bool, optional
+        Whether to write logs or not. The default is False.
+
+    Yields
+    ------
+    itf : win32com.client.CDispatch
+        COM object of the C3Dserver with the C3D file opened.
+
+    Notes
+    -----
+    The file is opened by open_c3d(), and the header values and the marker/analog labels are read into the cache right away.
+    The file is closed by close_c3d() when the block exits, even if an exception is raised. It is not saved automatically.
+
+    """
+    open_c3d(itf, f_path, strict_param_check=strict_param_check, log=log)
+    try:
+        _prime_itf_cache(itf, log=log)
+        yield itf
+    finally:
+        close_c3d(itf, log=log)
+
 def get_file_type(itf, log=False):
     """
     Return the file type of an open C3D file.
@@ -333,7 +534,7 @@ def get_data_type(itf, log=False):
     """
     try:
         dict_data_type = {1:'INTEGER', 2:'REAL'}
-        data_type = itf.GetDataType()
+        data_type = _get_cached(itf, 'data_type', itf.GetDataType)
         return dict_data_type.get(data_type, None)
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
@@ -361,7 +562,7 @@ def get_first_frame(itf, log=False):
 
     """
     try:
-        first_fr = itf.GetVideoFrame(0)
+        first_fr = _get_cached(itf, 'first_fr', lambda: itf.GetVideoFrame(0))
         return np.int32(first_fr)
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
@@ -389,12 +590,18 @@ def get_last_frame(itf, log=False):
 
     """
     try:
-        last_fr = itf.GetVideoFrame(1)
+        last_fr = _get_cached(itf, 'last_fr', lambda: itf.GetVideoFrame(1))
         return np.int32(last_fr)
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise
 
+def _get_frame_range(itf):
+    # first and last video frames as Python ints, so the frame arithmetic of the callers stays off 0-d numpy scalars
+    first_fr = _get_cached(itf, 'first_fr', lambda: itf.GetVideoFrame(0))
+    last_fr = _get_cached(itf, 'last_fr', lambda: itf.GetVideoFrame(1))
+    return int(first_fr), int(last_fr)
+
 def get_num_frames(itf, log=False):
     """
     Get the total number of frames in an open C3D file.
@@ -413,8 +620,7 @@ def get_num_frames(itf, log=False):
 
     """
     try:
-        first_fr = get_first_frame(itf, log=log)
-        last_fr = get_last_frame(itf, log=log)
+        first_fr, last_fr = _get_frame_range(itf)
         n_frs = last_fr-first_fr+1
         return np.int32(n_frs)        
     except pythoncom.com_error as err:
@@ -447,8 +653,7 @@ def check_frame_range_valid(itf, start_frame=None, end_frame=None, log=False):
 
     """
     try:
-        first_fr = get_first_frame(itf, log=log)
-        last_fr = get_last_frame(itf, log=log)
+        first_fr, last_fr = _get_frame_range(itf)
         if start_frame is None:
             start_fr = first_fr
         else:
@@ -492,7 +697,7 @@ def get_video_fps(itf, log=False):
 
     """
     try:
-        vid_fps = itf.GetVideoFrameRate()
+        vid_fps = _get_cached(itf, 'vid_fps', itf.GetVideoFrameRate)
         return np.float32(vid_fps)
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
@@ -516,7 +721,7 @@ def get_analog_video_ratio(itf, log=False):
 
     """
     try:
-        av_ratio = itf.GetAnalogVideoRatio()
+        av_ratio = _get_cached(itf, 'av_ratio', itf.GetAnalogVideoRatio)
         return np.int32(av_ratio)
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
@@ -542,7 +747,7 @@ def get_analog_fps(itf, log=False):
     try:
         vid_fps = get_video_fps(itf, log=log)
         av_ratio = get_analog_video_ratio(itf, log=log)
-        return np.float32(vid_fps*np.float32(av_ratio))
+        return np.float32(float(vid_fps)*int(av_ratio))
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise
@@ -565,10 +770,9 @@ def get_video_frames(itf, log=False):
 
     """
     try:
-        first_fr = get_first_frame(itf, log=log)
-        last_fr = get_last_frame(itf, log=log)
+        first_fr, last_fr = _get_frame_range(itf)
         n_frs = last_fr-first_fr+1
-        frs = np.linspace(start=first_fr, stop=last_fr, num=n_frs, dtype=np.int32)
+        frs = np.arange(first_fr, first_fr+n_frs, dtype=np.int32)
         return frs       
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
@@ -592,14 +796,11 @@ def get_analog_frames(itf, log=False):
 
     """
     try:
-        first_fr = get_first_frame(itf, log=log)
-        last_fr = get_last_frame(itf, log=log)  
+        first_fr, last_fr = _get_frame_range(itf)
         av_ratio = get_analog_video_ratio(itf, log=log)
-        start_fr = np.float32(first_fr)
-        end_fr = np.float32(last_fr)+np.float32(av_ratio-1)/np.float32(av_ratio)
         n_frs = last_fr-first_fr+1
         analog_steps = n_frs*av_ratio
-        frs = np.linspace(start=start_fr, stop=end_fr, num=analog_steps, dtype=np.float32)
+        frs = (first_fr+np.arange(analog_steps)/av_ratio).astype(np.float32)
         return frs
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
@@ -625,14 +826,13 @@ def get_video_times(itf, from_zero=True, log=False):
 
     """
     try:
-        first_fr = get_first_frame(itf, log=log)
-        last_fr = get_last_frame(itf, log=log)
+        first_fr, last_fr = _get_frame_range(itf)
         vid_fps = get_video_fps(itf, log=log)
         offset_fr = first_fr if from_zero else 0
-        start_t = np.float32(first_fr-offset_fr)/vid_fps
-        end_t = np.float32(last_fr-offset_fr)/vid_fps
-        n_frs = last_fr-first_fr+1
-        t = np.linspace(start=start_t, stop=end_t, num=n_frs, dtype=np.float32)
+        n_frs = int(last_fr-first_fr+1)
+        t = np.arange(n_frs, dtype=np.float32)
+        t += int(first_fr-offset_fr)
+        t *= 1.0/float(vid_fps)
         return t        
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
@@ -658,22 +858,140 @@ def get_analog_times(itf, from_zero=True, log=False):
 
     """
     try:
-        first_fr = get_first_frame(itf, log=log)
-        last_fr = get_last_frame(itf, log=log)
-        vid_fps = get_video_fps(itf, log=log)
+        first_fr, last_fr = _get_frame_range(itf)
         analog_fps = get_analog_fps(itf, log=log)
-        av_ratio = get_analog_video_ratio(itf, log=log)
+        av_ratio = int(get_analog_video_ratio(itf, log=log))
         offset_fr = first_fr if from_zero else 0
-        start_t = np.float32(first_fr-offset_fr)/vid_fps
-        end_t = np.float32(last_fr-offset_fr)/vid_fps+np.float32(av_ratio-1)/analog_fps
-        vid_steps = last_fr-first_fr+1
+        vid_steps = int(last_fr-first_fr+1)
         analog_steps = vid_steps*av_ratio
-        t = np.linspace(start=start_t, stop=end_t, num=analog_steps, dtype=np.float32)
+        t = np.arange(analog_steps, dtype=np.float32)
+        t += int(first_fr-offset_fr)*av_ratio
+        t *= 1.0/float(analog_fps)
         return t        
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise
 
+def _get_sel_indices(sel_masks, n):
+    sel_masks = np.asarray(sel_masks)
+    if sel_masks.dtype == bool:
+        if sel_masks.shape != (n,):
+            err_msg = f'"sel_masks" should be a boolean array of length {n}'
+            raise ValueError(err_msg)
+        return np.flatnonzero(sel_masks)
+    sel_idx = np.asarray(sel_masks, dtype=np.int64).ravel()
+    sel_idx = np.where(sel_idx < 0, sel_idx+n, sel_idx)
+    if np.any((sel_idx < 0) | (sel_idx >= n)):
+        err_msg = f'"sel_masks" should contain indices in the range of [{-n}, {n-1}]'
+        raise ValueError(err_msg)
+    return sel_idx
+
+def get_video_times_subset(itf, sel_masks, from_zero=True, log=False):
+    """
+    Return a float-type numpy array that contains the times corresponding to the selected video frames.
+
+    Parameters
+    ----------
+    itf : win32com.client.CDispatch
+        COM object of the C3Dserver.
+    sel_masks : numpy array or list
+        Boolean mask (n,) over all the video frames, or integer indices of the selected video frames.
+    from_zero : bool, optional
+        Whether the return time array should start from zero or not. The default is True.
+    log : bool, optional
+        Whether to write logs or not. The default is False.
+
+    Returns
+    -------
+    t : numpy array
+        A float-type numpy array of the times corresponding to the selected video frames.
+
+    Notes
+    -----
+    The result is the same as get_video_times(itf, from_zero)[sel_masks], but only the selected times are computed.
+
+    """
+    try:
+        first_fr, last_fr = _get_frame_range(itf)
+        vid_fps = get_video_fps(itf, log=log)
+        offset_fr = first_fr if from_zero else 0
+        n_frs = int(last_fr-first_fr+1)
+        t = _get_sel_indices(sel_masks, n_frs).astype(np.float32)
+        t += int(first_fr-offset_fr)
+        t *= 1.0/float(vid_fps)
+        return t
+    except pythoncom.com_error as err:
+        if log: logger.error(err.excepinfo[2])
+        raise
+    except ValueError as err:
+        if log: logger.error(err)
+        raise
+
+def get_analog_times_subset(itf, sel_masks, from_zero=True, log=False):
+    """
+    Return a float-type numpy array that contains the times corresponding to the selected analog frames.
+
+    Parameters
+    ----------
+    itf : win32com.client.CDispatch
+        COM object of the C3Dserver.
+    sel_masks : numpy array or list
+        Boolean mask (n,) over all the analog frames, or integer indices of the selected analog frames.
+    from_zero : bool, optional
+        Whether the return time array should start from zero or not. The default is True.
+    log : bool, optional
+        Whether to write logs or not. The default is False.
+
+    Returns
+    -------
+    t : numpy array
+        A float-type numpy array of the times corresponding to the selected analog frames.
+
+    Notes
+    -----
+    The result is the same as get_analog_times(itf, from_zero)[sel_masks], but only the selected times are computed.
+
+    """
+    try:
+        first_fr, last_fr = _get_frame_range(itf)
+        analog_fps = get_analog_fps(itf, log=log)
+        av_ratio = int(get_analog_video_ratio(itf, log=log))
+        offset_fr = first_fr if from_zero else 0
+        analog_steps = int(last_fr-first_fr+1)*av_ratio
+        t = _get_sel_indices(sel_masks, analog_steps).astype(np.float32)
+        t += int(first_fr-offset_fr)*av_ratio
+        t *= 1.0/float(analog_fps)
+        return t
+    except pythoncom.com_error as err:
+        if log: logger.error(err.excepinfo[2])
+        raise
+    except ValueError as err:
+        if log: logger.error(err)
+        raise
+
+def _get_point_labels(itf, log=False):
+    cache = _get_itf_cache(itf)
+    if 'pt_labels' in cache:
+        return cache['pt_labels']
+    idx_pt_labels, n_pt_labels = _resolve_param(itf, 'POINT', 'LABELS', log=log)
+    if idx_pt_labels is None:
+        return None, None
+    idx_pt_used = itf.GetParameterIndex('POINT', 'USED')
+    if idx_pt_used == -1:
+        if log: logger.warning('POINT:USED does not exist')
+        return None, None
+    n_pt_used = itf.GetParameterValue(idx_pt_used, 0)
+    if n_pt_used < 1:
+        if log: logger.warning('POINT:USED is zero')
+        return None, None
+    get_par_val = itf.GetParameterValue
+    mkr_names = [get_par_val(idx_pt_labels, i) for i in range(min(n_pt_labels, n_pt_used))]
+    dict_mkr_idx = {}
+    for i, name in enumerate(mkr_names):
+        dict_mkr_idx.setdefault(name, i)
+    cache['pt_labels'] = (mkr_names, dict_mkr_idx)
+    return mkr_names, dict_mkr_idx
+
 def get_marker_names(itf, log=False):
     """
     Return a string-type list of the marker names from an open C3D file.
@@ -694,27 +1012,10 @@ def get_marker_names(itf, log=False):
         
     """
     try:
-        mkr_names = []
-        idx_pt_labels = itf.GetParameterIndex('POINT', 'LABELS')
-        if idx_pt_labels == -1:
-            if log: logger.warning('POINT:LABELS does not exist')
+        mkr_names, _ = _get_point_labels(itf, log=log)
+        if mkr_names is None:
             return None
-        n_pt_labels = itf.GetParameterLength(idx_pt_labels)
-        if n_pt_labels < 1:
-            if log: logger.warning('No item under POINT:LABELS')
-            return None
-        idx_pt_used = itf.GetParameterIndex('POINT', 'USED')
-        if idx_pt_used == -1:
-            if log: logger.warning('POINT:USED does not exist')
-            return None
-        n_pt_used = itf.GetParameterValue(idx_pt_used, 0)
-        if n_pt_used < 1:
-            if log: logger.warning('POINT:USED is zero')
-            return None
-        for i in range(n_pt_labels):
-            if i < n_pt_used:
-                mkr_names.append(itf.GetParameterValue(idx_pt_labels, i))
-        return mkr_names
+        return list(mkr_names)
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise    
@@ -742,36 +1043,46 @@ def get_marker_index(itf, mkr_name, log=False):
 
     """
     try:
-        idx_pt_labels = itf.GetParameterIndex('POINT', 'LABELS')
-        if idx_pt_labels == -1:
-            if log: logger.warning('POINT:LABELS does not exist')
-            return None
-        n_pt_labels = itf.GetParameterLength(idx_pt_labels)
-        if n_pt_labels < 1:
-            if log: logger.warning('No item under POINT:LABELS')
+        _, dict_mkr_idx = _get_point_labels(itf, log=log)
+        if dict_mkr_idx is None:
             return None
-        idx_pt_used = itf.GetParameterIndex('POINT', 'USED')
-        if idx_pt_used == -1:
-            if log: logger.warning('POINT:USED does not exist')
-            return None
-        n_pt_used = itf.GetParameterValue(idx_pt_used, 0)
-        if n_pt_used < 1:
-            if log: logger.warning('POINT:USED is zero')
-            return None
-        mkr_idx = -1
-        for i in range(n_pt_labels):
-            if i < n_pt_used:
-                tgt_name = itf.GetParameterValue(idx_pt_labels, i)
-                if tgt_name == mkr_name:
-                    mkr_idx = i
-                    break  
+        mkr_idx = dict_mkr_idx.get(mkr_name, -1)
         if mkr_idx == -1:
-            if log: logger.warning(f'"{mkr_name}" does not exist')
+            if log: logger.warning('"%s" does not exist', mkr_name)
         return mkr_idx
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise    
 
+def get_marker_index_map(itf, log=False):
+    """
+    Return a dictionary that maps the marker names to their indices in an open C3D file.
+
+    Parameters
+    ----------
+    itf : win32com.client.CDispatch
+        COM object of the C3Dserver.
+    log : bool, optional
+        Whether to write logs or not. The default is False.
+
+    Returns
+    -------
+    dict_mkr_idx : dict or None
+        Dictionary of the marker indices with the marker names as keys.
+        If a name appears more than once in the POINT:LABELS parameter, its first index is used, as in get_marker_index().
+        None if there is no POINT:LABELS parameter.
+        None if there is no item in the POINT:LABELS parameter.
+
+    """
+    try:
+        _, dict_mkr_idx = _get_point_labels(itf, log=log)
+        if dict_mkr_idx is None:
+            return None
+        return dict(dict_mkr_idx)
+    except pythoncom.com_error as err:
+        if log: logger.error(err.excepinfo[2])
+        raise
+
 def get_marker_unit(itf, log=False):
     """
     Return the unit of the marker coordinate values in an open C3D file.
@@ -792,16 +1103,18 @@ def get_marker_unit(itf, log=False):
 
     """
     try:
-        idx_pt_units = itf.GetParameterIndex('POINT', 'UNITS')
-        if idx_pt_units == -1: 
-            if log: logger.warning('POINT:UNITS does not exist')
+        cache = _get_itf_cache(itf)
+        if 'pt_units' in cache:
+            return cache['pt_units']
+        idx_pt_units, n_items = _resolve_param(itf, 'POINT', 'UNITS', log=log)
+        if idx_pt_units is None:
             return None
-        n_items = itf.GetParameterLength(idx_pt_units)
-        if n_items != 1: 
+        if n_items != 1:
             if log: logger.warning('No proper item under POINT:UNITS')
             return None
         # unit = itf.GetParameterValue(idx_pt_units, n_items-1)
         unit = itf.GetParameterValue(idx_pt_units, 0)
+        cache['pt_units'] = unit
         return unit
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
@@ -827,22 +1140,38 @@ def get_marker_scale(itf, log=False):
     
     """
     try:
-        idx_pt_scale = itf.GetParameterIndex('POINT', 'SCALE')
-        if idx_pt_scale == -1:
-            if log: logger.warning('POINT:SCALE does not exist')
+        cache = _get_itf_cache(itf)
+        if 'pt_scale' in cache:
+            return cache['pt_scale']
+        idx_pt_scale, n_items = _resolve_param(itf, 'POINT', 'SCALE', log=log)
+        if idx_pt_scale is None:
             return None
-        n_items = itf.GetParameterLength(idx_pt_scale)
         if n_items != 1:
             if log: logger.warning('No proper item under POINT:SCALE')
             return None
         # scale = np.float32(itf.GetParameterValue(idx_pt_scale, n_items-1))
         scale = np.float32(itf.GetParameterValue(idx_pt_scale, 0))
+        cache['pt_scale'] = scale
         return scale
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise    
 
-def get_marker_data(itf, mkr_name, blocked_nan=False, start_frame=None, end_frame=None, log=False):
+def _get_c3d_float_flag(itf, log=False):
+    cache = _get_itf_cache(itf)
+    if 'c3d_float' in cache:
+        return cache['c3d_float']
+    mkr_scale = get_marker_scale(itf, log=log)
+    if mkr_scale is None:
+        return None
+    is_c3d_float = bool(mkr_scale < 0)
+    is_c3d_float2 = _get_cached(itf, 'data_type', itf.GetDataType) == 2
+    if is_c3d_float != is_c3d_float2:
+        if log: logger.debug('C3D data type is determined by POINT:SCALE')
+    cache['c3d_float'] = is_c3d_float
+    return is_c3d_float
+
+def get_marker_data(itf, mkr_name, blocked_nan=False, start_frame=None, end_frame=None, log=False, out=None, resid=True):
     """
     Return the scaled marker coordinate values and the residuals in an open C3D file.
 
@@ -860,11 +1189,16 @@ def get_marker_data(itf, mkr_name, blocked_nan=False, start_frame=None, end_fram
         User-defined end frame.
     log : bool, optional
         Whether to write logs or not. The default is False.         
+    out : numpy array or None, optional
+        Pre-allocated float32 array (n, 4), or (n, 3) if 'resid' is False, to write the output into. The default is None.
+    resid : bool, optional
+        Whether to include the residual values in the output or not. The default is True.
+        If False, the residuals are only read from the C3D file when 'blocked_nan' is True.
 
     Returns
     -------
     mkr_data : numpy array or None
-        2D numpy array (n, 4), where n is the number of frames in the output.
+        2D numpy array (n, 4), or (n, 3) if 'resid' is False, where n is the number of frames in the output.
         For each row, the first three columns contains the x, y, z coordinates of the marker at each frame.
         For each row, The last (fourth) column contains the residual value.
         None if there is no corresponding marker name in the C3D file.
@@ -873,31 +1207,138 @@ def get_marker_data(itf, mkr_name, blocked_nan=False, start_frame=None, end_fram
     try:
         mkr_idx = get_marker_index(itf, mkr_name, log=log)
         if mkr_idx == -1 or mkr_idx is None:
-            if log: logger.warning(f'Unable to get the index of "{mkr_name}"')
+            if log: logger.warning('Unable to get the index of "%s"', mkr_name)
             return None
         fr_check, start_fr, end_fr = check_frame_range_valid(itf, start_frame, end_frame, log=log)
         if not fr_check:
             if log: logger.warning('No valid conditions for "start_frame" and "end_frame"')
             return None
         n_frs = end_fr-start_fr+1
-        mkr_data = np.full((n_frs, 4), np.nan, dtype=np.float32)
+        n_cols = 4 if resid else 3
+        if out is None:
+            mkr_data = np.empty((n_frs, n_cols), dtype=np.float32)
+        else:
+            if out.shape != (n_frs, n_cols) or out.dtype != np.float32:
+                err_msg = f'"out" should be a float32 array of shape ({n_frs}, {n_cols})'
+                raise ValueError(err_msg)
+            mkr_data = out
+        mkr_resid = None
         if start_fr == end_fr:
             for i in range(3):
                 mkr_data[:,i] = np.asarray(itf.GetPointData(mkr_idx, i, start_fr, '1'), dtype=np.float32)
-            mkr_data[:,3] = np.asarray(itf.GetPointResidual(mkr_idx, start_fr), dtype=np.float32)
+            if resid or blocked_nan:
+                mkr_resid = np.asarray(itf.GetPointResidual(mkr_idx, start_fr), dtype=np.float32).reshape(-1)
         else:
+            get_pt_data = itf.GetPointDataEx
             for i in range(3):
-                mkr_data[:,i] = np.asarray(itf.GetPointDataEx(mkr_idx, i, start_fr, end_fr, '1'), dtype=np.float32)
-            mkr_data[:,3] = np.asarray(itf.GetPointResidualEx(mkr_idx, start_fr, end_fr), dtype=np.float32)
+                mkr_data[:,i] = _com_to_array(get_pt_data(mkr_idx, i, start_fr, end_fr, '1'), np.float32, n_frs)
+            if resid or blocked_nan:
+                mkr_resid = _com_to_array(itf.GetPointResidualEx(mkr_idx, start_fr, end_fr), np.float32, n_frs)
+        if resid:
+            mkr_data[:,3] = mkr_resid
         if blocked_nan:
-            mkr_null_masks = np.where(np.isclose(mkr_data[:,3], -1), True, False)
-            mkr_data[mkr_null_masks,0:3] = np.nan 
+            mkr_null_masks = np.equal(mkr_resid, -1)
+            np.copyto(mkr_data[:,0:3], np.nan, where=mkr_null_masks[:,None])
         return mkr_data
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
+        raise
+    except ValueError as err:
+        if log: logger.error(err)
         raise    
 
-def get_marker_pos(itf, mkr_name, blocked_nan=False, scaled=True, start_frame=None, end_frame=None, log=False):
+def _read_markers(itf, mkr_names, blocked_nan, scaled, start_frame, end_frame, resid, log=False):
+    # shared reader of get_markers_data() and get_marker_pos_many(): (m, n, 3) coordinates, or (m, n, 4) with the residuals if 'resid'
+    if mkr_names is None:
+        mkr_names = get_marker_names(itf, log=log)
+        if mkr_names is None:
+            if log: logger.warning('Unable to get the marker names')
+            return None
+    mkr_idxs = []
+    for mkr_name in mkr_names:
+        mkr_idx = get_marker_index(itf, mkr_name, log=log)
+        if mkr_idx == -1 or mkr_idx is None:
+            if log: logger.warning('Unable to get the index of "%s"', mkr_name)
+            return None
+        mkr_idxs.append(mkr_idx)
+    fr_check, start_fr, end_fr = check_frame_range_valid(itf, start_frame, end_frame, log=log)
+    if not fr_check:
+        if log: logger.warning('No valid conditions for "start_frame" and "end_frame"')
+        return None
+    n_frs = end_fr-start_fr+1
+    n_mkrs = len(mkr_idxs)
+    if blocked_nan or scaled:
+        mkr_dtype = np.float32
+    else:
+        is_c3d_float = _get_c3d_float_flag(itf, log=log)
+        if is_c3d_float is None:
+            if log: logger.warning('Unable to get the marker scale factor')
+            return None
+        mkr_dtype = np.float32 if is_c3d_float else np.int16
+    mkr_data = np.empty((n_mkrs, n_frs, 4 if resid else 3), dtype=mkr_dtype)
+    if resid:
+        mkr_resid = mkr_data[:,:,3]
+    elif blocked_nan:
+        mkr_resid = np.empty((n_mkrs, n_frs), dtype=np.float32)
+    b_scaled = '1' if scaled else '0'
+    if start_fr == end_fr:
+        for j, mkr_idx in enumerate(mkr_idxs):
+            for i in range(3):
+                mkr_data[j,:,i] = np.asarray(itf.GetPointData(mkr_idx, i, start_fr, b_scaled), dtype=mkr_dtype)
+            if resid or blocked_nan:
+                mkr_resid[j,:] = np.asarray(itf.GetPointResidual(mkr_idx, start_fr), dtype=np.float32)
+    else:
+        get_pt_data = itf.GetPointDataEx
+        get_pt_resid = itf.GetPointResidualEx
+        for j, mkr_idx in enumerate(mkr_idxs):
+            for i in range(3):
+                mkr_data[j,:,i] = _com_to_array(get_pt_data(mkr_idx, i, start_fr, end_fr, b_scaled), mkr_dtype, n_frs)
+            if resid or blocked_nan:
+                mkr_resid[j,:] = _com_to_array(get_pt_resid(mkr_idx, start_fr, end_fr), np.float32, n_frs)
+    if blocked_nan:
+        mkr_null_masks = np.equal(mkr_resid, -1)
+        np.copyto(mkr_data[:,:,0:3], np.nan, where=mkr_null_masks[:,:,None])
+    return mkr_data
+
+def get_markers_data(itf, mkr_names=None, blocked_nan=False, start_frame=None, end_frame=None, log=False):
+    """
+    Return the scaled coordinate values and the residuals of multiple markers in an open C3D file.
+
+    Parameters
+    ----------
+    itf : win32com.client.CDispatch
+        COM object of the C3Dserver.
+    mkr_names : list or tuple or None, optional
+        Marker names. If None, all the markers in the C3D file will be used. The default is None.
+    blocked_nan : bool, optional
+        Whether to set the coordinates of blocked frames as nan. The default is False.
+    start_frame: None or int, optional
+        User-defined start frame.
+    end_frame: None or int, optional
+        User-defined end frame.
+    log : bool, optional
+        Whether to write logs or not. The default is False.
+
+    Returns
+    -------
+    mkr_data : numpy array or None
+        3D numpy array (m, n, 4), where m is the number of markers and n is the number of frames in the output.
+        For each marker, the first three columns contains the x, y, z coordinates and the last (fourth) column contains the residual value.
+        None if any of the marker names does not exist in the C3D file.
+
+    Notes
+    -----
+    The result is the same as stacking get_marker_data() of each marker,
+    but the frame range and the marker indices are resolved only once and the output is a single contiguous array.
+
+    """
+    try:
+        return _read_markers(itf, mkr_names, blocked_nan, True, start_frame, end_frame, True, log=log)
+    except pythoncom.com_error as err:
+        if log: logger.error(err.excepinfo[2])
+        raise
+
+def get_marker_pos(itf, mkr_name, blocked_nan=False, scaled=True, start_frame=None, end_frame=None, log=False, out=None):
     """
     Return a specific marker's coordinate values in an open C3D file.
 
@@ -917,6 +1358,8 @@ def get_marker_pos(itf, mkr_name, blocked_nan=False, scaled=True, start_frame=No
         User-defined end frame.
     log : bool, optional
         Whether to write logs or not. The default is False.           
+    out : numpy array or None, optional
+        Pre-allocated array (n, 3) to write the output into. Its dtype should match the output dtype. The default is None.
 
     Returns
     -------
@@ -933,42 +1376,91 @@ def get_marker_pos(itf, mkr_name, blocked_nan=False, scaled=True, start_frame=No
     try:
         mkr_idx = get_marker_index(itf, mkr_name, log=log)
         if mkr_idx == -1 or mkr_idx is None:
-            if log: logger.warning(f'Unable to get the index of "{mkr_name}"')
+            if log: logger.warning('Unable to get the index of "%s"', mkr_name)
             return None
         fr_check, start_fr, end_fr = check_frame_range_valid(itf, start_frame, end_frame, log=log)
         if not fr_check:
             if log: logger.warning('No valid conditions for "start_frame" and "end_frame"')
             return None
         n_frs = end_fr-start_fr+1
-        mkr_scale = get_marker_scale(itf, log=log)
-        if mkr_scale is None:
-            if log: logger.warning(f'Unable to get the marker scale factor')
+        is_c3d_float = _get_c3d_float_flag(itf, log=log)
+        if is_c3d_float is None:
+            if log: logger.warning('Unable to get the marker scale factor')
             return None
-        is_c3d_float = mkr_scale < 0
-        is_c3d_float2 = [False, True][itf.GetDataType()-1]
-        if is_c3d_float != is_c3d_float2:
-            if log: logger.debug(f'C3D data type is determined by POINT:SCALE')
-        mkr_dtype = [[[np.int16, np.float32][is_c3d_float], np.float32][scaled], np.float32][blocked_nan]
-        mkr_data = np.zeros((n_frs, 3), dtype=mkr_dtype)
-        b_scaled = ['0', '1'][scaled]
+        if blocked_nan or scaled or is_c3d_float:
+            mkr_dtype = np.float32
+        else:
+            mkr_dtype = np.int16
+        if out is None:
+            mkr_data = np.empty((n_frs, 3), dtype=mkr_dtype)
+        else:
+            if out.shape != (n_frs, 3) or out.dtype != mkr_dtype:
+                err_msg = f'"out" should be a {np.dtype(mkr_dtype).name} array of shape ({n_frs}, 3)'
+                raise ValueError(err_msg)
+            mkr_data = out
+        b_scaled = '1' if scaled else '0'
         if start_fr == end_fr:
             for i in range(3):
                 mkr_data[:,i] = np.asarray(itf.GetPointData(mkr_idx, i, start_fr, b_scaled), dtype=mkr_dtype)
         else:
+            get_pt_data = itf.GetPointDataEx
             for i in range(3):
-                mkr_data[:,i] = np.asarray(itf.GetPointDataEx(mkr_idx, i, start_fr, end_fr, b_scaled), dtype=mkr_dtype)
+                mkr_data[:,i] = _com_to_array(get_pt_data(mkr_idx, i, start_fr, end_fr, b_scaled), mkr_dtype, n_frs)
         if blocked_nan:
             if start_fr == end_fr:
                 mkr_resid = np.asarray(itf.GetPointResidual(mkr_idx, start_fr), dtype=np.float32)
             else:
-                mkr_resid = np.asarray(itf.GetPointResidualEx(mkr_idx, start_fr, end_fr), dtype=np.float32)
-            mkr_null_masks = np.where(np.isclose(mkr_resid, -1), True, False)
-            mkr_data[mkr_null_masks,:] = np.nan  
+                mkr_resid = _com_to_array(itf.GetPointResidualEx(mkr_idx, start_fr, end_fr), np.float32, n_frs)
+            mkr_null_masks = np.equal(mkr_resid, -1)
+            np.copyto(mkr_data, np.nan, where=mkr_null_masks.reshape(-1, 1))
         return mkr_data
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
+        raise
+    except ValueError as err:
+        if log: logger.error(err)
         raise    
 
+def get_marker_pos_many(itf, mkr_names=None, blocked_nan=False, scaled=True, start_frame=None, end_frame=None, log=False):
+    """
+    Return the coordinate values of multiple markers in an open C3D file.
+
+    Parameters
+    ----------
+    itf : win32com.client.CDispatch
+        COM object of the C3Dserver.
+    mkr_names : list or tuple or None, optional
+        Marker names. If None, all the markers in the C3D file will be used. The default is None.
+    blocked_nan : bool, optional
+        Whether to set the coordinates of blocked frames as nan. The default is False.
+    scaled : bool, optional
+        Whether to return the scaled coordinate values or not. The default is True.
+    start_frame: None or int, optional
+        User-defined start frame.
+    end_frame: None or int, optional
+        User-defined end frame.
+    log : bool, optional
+        Whether to write logs or not. The default is False.
+
+    Returns
+    -------
+    mkr_data : numpy array or None
+        3D numpy array (m, n, 3), where m is the number of markers and n is the number of frames in the output.
+        If 'blocked_nan' is set as True, then the corresponding rows in the 'mkr_data' will be filled with nan.
+        None if any of the marker names does not exist in the C3D file.
+
+    Notes
+    -----
+    The result is the same as stacking get_marker_pos() of each marker,
+    but the frame range, the marker indices and the scale factor are resolved only once.
+
+    """
+    try:
+        return _read_markers(itf, mkr_names, blocked_nan, scaled, start_frame, end_frame, False, log=log)
+    except pythoncom.com_error as err:
+        if log: logger.error(err.excepinfo[2])
+        raise
+
 def get_marker_pos2(itf, mkr_name, blocked_nan=False, scaled=True, start_frame=None, end_frame=None, log=False):
     """
     Return a specific marker's coordinate values in an open C3D file.
@@ -1009,47 +1501,44 @@ def get_marker_pos2(itf, mkr_name, blocked_nan=False, scaled=True, start_frame=N
     try:
         mkr_idx = get_marker_index(itf, mkr_name, log=log)
         if mkr_idx == -1 or mkr_idx is None:
-            if log: logger.warning(f'Unable to get the index of "{mkr_name}"')
+            if log: logger.warning('Unable to get the index of "%s"', mkr_name)
             return None
         fr_check, start_fr, end_fr = check_frame_range_valid(itf, start_frame, end_frame, log=log)
         if not fr_check:
             if log: logger.warning('No valid conditions for "start_frame" and "end_frame"')
             return None
         n_frs = end_fr-start_fr+1
-        mkr_scale = get_marker_scale(itf, log=log)
-        if mkr_scale is None:
-            if log: logger.warning(f'Unable to get the marker scale factor')
+        is_c3d_float = _get_c3d_float_flag(itf, log=log)
+        if is_c3d_float is None:
+            if log: logger.warning('Unable to get the marker scale factor')
             return None        
-        is_c3d_float = mkr_scale < 0
-        is_c3d_float2 = [False, True][itf.GetDataType()-1]
-        if is_c3d_float != is_c3d_float2:
-            if log: logger.debug(f'C3D data type is determined by POINT:SCALE')
-        mkr_dtype = [[[np.int16, np.float32][is_c3d_float], np.float32][scaled], np.float32][blocked_nan]
-        mkr_data = np.zeros((n_frs, 3), dtype=mkr_dtype)
-        scale_size = [np.fabs(mkr_scale), np.float32(1.0)][is_c3d_float]
+        if blocked_nan or scaled or is_c3d_float:
+            mkr_dtype = np.float32
+        else:
+            mkr_dtype = np.int16
+        mkr_data = np.empty((n_frs, 3), dtype=mkr_dtype)
+        # float-format files are already in real units, so only integer data needs the POINT:SCALE pass
+        scale_size = np.fabs(get_marker_scale(itf, log=log)) if (scaled and not is_c3d_float) else None
         if start_fr == end_fr:
             for i in range(3):
-                if scaled:
-                    mkr_data[:,i] = np.asarray(itf.GetPointData(mkr_idx, i, start_fr, '0'), dtype=mkr_dtype)*scale_size
-                else:
-                    mkr_data[:,i] = np.asarray(itf.GetPointData(mkr_idx, i, start_fr, '0'), dtype=mkr_dtype)                
+                mkr_data[:,i] = np.asarray(itf.GetPointData(mkr_idx, i, start_fr, '0'), dtype=mkr_dtype)
         else:
+            get_pt_data = itf.GetPointDataEx
             for i in range(3):
-                if scaled:
-                    mkr_data[:,i] = np.asarray(itf.GetPointDataEx(mkr_idx, i, start_fr, end_fr, '0'), dtype=mkr_dtype)*scale_size
-                else:
-                    mkr_data[:,i] = np.asarray(itf.GetPointDataEx(mkr_idx, i, start_fr, end_fr, '0'), dtype=mkr_dtype)
+                mkr_data[:,i] = _com_to_array(get_pt_data(mkr_idx, i, start_fr, end_fr, '0'), mkr_dtype, n_frs)
+        mkr_resid = None
         if blocked_nan:
             if start_fr == end_fr:
                 mkr_resid = np.asarray(itf.GetPointResidual(mkr_idx, start_fr), dtype=np.float32)
             else:
-                mkr_resid = np.asarray(itf.GetPointResidualEx(mkr_idx, start_fr, end_fr), dtype=np.float32)
-            mkr_null_masks = np.where(np.isclose(mkr_resid, -1), True, False)
-            mkr_data[mkr_null_masks,:] = np.nan            
-        return mkr_data
+                mkr_resid = _com_to_array(itf.GetPointResidualEx(mkr_idx, start_fr, end_fr), np.float32, n_frs)
+        return _finalize_marker_pos(mkr_data, scale_size, mkr_resid)
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise    
+    except ValueError as err:
+        if log: logger.error(err)
+        raise
 
 def get_marker_resid(itf, mkr_name, start_frame=None, end_frame=None, log=False):
     """
@@ -1077,7 +1566,7 @@ def get_marker_resid(itf, mkr_name, start_frame=None, end_frame=None, log=False)
     try:
         mkr_idx = get_marker_index(itf, mkr_name, log=log)
         if mkr_idx == -1 or mkr_idx is None:
-            if log: logger.warning(f'Unable to get the index of "{mkr_name}"')
+            if log: logger.warning('Unable to get the index of "%s"', mkr_name)
             return None
         fr_check, start_fr, end_fr = check_frame_range_valid(itf, start_frame, end_frame, log=log)
         if not fr_check:
@@ -1086,11 +1575,34 @@ def get_marker_resid(itf, mkr_name, start_frame=None, end_frame=None, log=False)
         if start_fr == end_fr:
             mkr_resid = np.asarray(itf.GetPointResidual(mkr_idx, start_fr), dtype=np.float32)
         else:
-            mkr_resid = np.asarray(itf.GetPointResidualEx(mkr_idx, start_fr, end_fr), dtype=np.float32)
+            mkr_resid = _com_to_array(itf.GetPointResidualEx(mkr_idx, start_fr, end_fr), np.float32, end_fr-start_fr+1)
         return mkr_resid
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise
+    except ValueError as err:
+        if log: logger.error(err)
+        raise
+
+def _get_analog_labels(itf, log=False):
+    cache = _get_itf_cache(itf)
+    if 'anl_labels' in cache:
+        return cache['anl_labels']
+    idx_anl_labels, n_anl_labels = _resolve_param(itf, 'ANALOG', 'LABELS', log=log)
+    if idx_anl_labels is None:
+        return None, None
+    idx_anl_used = itf.GetParameterIndex('ANALOG', 'USED')
+    if idx_anl_used == -1:
+        if log: logger.warning('ANALOG:USED does not exist')
+        return None, None
+    n_anl_used = itf.GetParameterValue(idx_anl_used, 0)
+    get_par_val = itf.GetParameterValue
+    sig_names = [get_par_val(idx_anl_labels, i) for i in range(max(0, min(n_anl_labels, n_anl_used)))]
+    dict_sig_idx = {}
+    for i, name in enumerate(sig_names):
+        dict_sig_idx.setdefault(name, i)
+    cache['anl_labels'] = (sig_names, dict_sig_idx)
+    return sig_names, dict_sig_idx
 
 def get_analog_names(itf, log=False):
     """
@@ -1110,24 +1622,10 @@ def get_analog_names(itf, log=False):
 
     """
     try:
-        sig_names = []
-        idx_anl_labels = itf.GetParameterIndex('ANALOG', 'LABELS')
-        if idx_anl_labels == -1:
-            if log: logger.warning('ANALOG:LABELS does not exist')
+        sig_names, _ = _get_analog_labels(itf, log=log)
+        if sig_names is None:
             return None
-        n_anl_labels = itf.GetParameterLength(idx_anl_labels)
-        if n_anl_labels < 1:
-            if log: logger.warning('No item under ANALOG:LABELS')
-            return None
-        idx_anl_used = itf.GetParameterIndex('ANALOG', 'USED')
-        if idx_anl_used == -1:
-            if log: logger.warning('ANALOG:USED does not exist')
-            return None        
-        n_anl_used = itf.GetParameterValue(idx_anl_used, 0)    
-        for i in range(n_anl_labels):
-            if i < n_anl_used:
-                sig_names.append(itf.GetParameterValue(idx_anl_labels, i))
-        return sig_names
+        return list(sig_names)
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise    
@@ -1152,28 +1650,12 @@ def get_analog_index(itf, sig_name, log=False):
 
     """
     try:
-        idx_anl_labels = itf.GetParameterIndex('ANALOG', 'LABELS')
-        if idx_anl_labels == -1:
-            if log: logger.warning('ANALOG:LABELS does not exist')
-            return None
-        n_anl_labels = itf.GetParameterLength(idx_anl_labels)
-        if n_anl_labels < 1:
-            if log: logger.warning('No item under ANALOG:LABELS')
-            return None
-        idx_anl_used = itf.GetParameterIndex('ANALOG', 'USED')
-        if idx_anl_used == -1:
-            if log: logger.warning('ANALOG:USED does not exist')
+        _, dict_sig_idx = _get_analog_labels(itf, log=log)
+        if dict_sig_idx is None:
             return None
-        n_anl_used = itf.GetParameterValue(idx_anl_used, 0)    
-        sig_idx = -1    
-        for i in range(n_anl_labels):
-            if i < n_anl_used:
-                tgt_name = itf.GetParameterValue(idx_anl_labels, i)
-                if tgt_name == sig_name:
-                    sig_idx = i
-                    break
+        sig_idx = dict_sig_idx.get(sig_name, -1)
         if sig_idx == -1:
-            if log: logger.warning(f'"{sig_name}" does not exist')
+            if log: logger.warning('"%s" does not exist', sig_name)
         return sig_idx
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
@@ -1199,11 +1681,9 @@ def get_analog_gen_scale(itf, log=False):
         
     """
     try:
-        par_idx = itf.GetParameterIndex('ANALOG', 'GEN_SCALE')
-        if par_idx == -1:
-            if log: logger.warning('ANALOG:GEN_SCALE does not exist')
+        par_idx, n_items = _resolve_param(itf, 'ANALOG', 'GEN_SCALE', log=log)
+        if par_idx is None:
             return None
-        n_items = itf.GetParameterLength(par_idx)
         if n_items != 1:
             if log: logger.warning('No proper item under ANALOG:GEN_SCALE')
             return None
@@ -1234,7 +1714,7 @@ def get_analog_format(itf, log=False):
         
     """
     try:
-        par_idx = itf.GetParameterIndex('ANALOG', 'FORMAT')
+        par_idx = _get_param_index(itf, 'ANALOG', 'FORMAT')
         if par_idx == -1:
             if log: logger.debug('ANALOG:FORMAT does not exist')
             return None
@@ -1271,9 +1751,9 @@ def get_analog_unit(itf, sig_name, log=False):
     try:
         sig_idx = get_analog_index(itf, sig_name, log=log)
         if sig_idx == -1 or sig_idx is None:
-            if log: logger.warning(f'Unable to get the index of "{sig_name}"')
+            if log: logger.warning('Unable to get the index of "%s"', sig_name)
             return None
-        par_idx = itf.GetParameterIndex('ANALOG', 'UNITS')
+        par_idx = _get_param_index(itf, 'ANALOG', 'UNITS')
         if par_idx == -1:
             if log: logger.warning('ANALOG:UNITS does not exist')
             return None
@@ -1305,9 +1785,9 @@ def get_analog_scale(itf, sig_name, log=False):
     try:
         sig_idx = get_analog_index(itf, sig_name, log=log)
         if sig_idx == -1 or sig_idx is None:
-            if log: logger.warning(f'Unable to get the index of "{sig_name}"')
+            if log: logger.warning('Unable to get the index of "%s"', sig_name)
             return None
-        par_idx = itf.GetParameterIndex('ANALOG', 'SCALE')
+        par_idx = _get_param_index(itf, 'ANALOG', 'SCALE')
         if par_idx == -1:
             if log: logger.warning('ANALOG:SCALE does not exist')
             return None
@@ -1339,15 +1819,15 @@ def get_analog_offset(itf, sig_name, log=False):
     try:
         sig_idx = get_analog_index(itf, sig_name, log=log)
         if sig_idx == -1 or sig_idx is None:
-            if log: logger.warning(f'Unable to get the index of "{sig_name}"')
+            if log: logger.warning('Unable to get the index of "%s"', sig_name)
             return None
-        par_idx = itf.GetParameterIndex('ANALOG', 'OFFSET')
+        par_idx = _get_param_index(itf, 'ANALOG', 'OFFSET')
         if par_idx == -1:
             if log: logger.warning('ANALOG:OFFSET does not exist')
             return None
         sig_format = get_analog_format(itf, log=log)
         is_sig_unsigned = (sig_format is not None) and (sig_format.upper()=='UNSIGNED')
-        par_dtype = [np.int16, np.uint16][is_sig_unsigned]
+        par_dtype = np.uint16 if is_sig_unsigned else np.int16
         sig_offset = par_dtype(itf.GetParameterValue(par_idx, sig_idx))
         return sig_offset
     except pythoncom.com_error as err:
@@ -1380,7 +1860,7 @@ def get_analog_data_unscaled(itf, sig_name, start_frame=None, end_frame=None, lo
     try:
         sig_idx = get_analog_index(itf, sig_name, log=log)
         if sig_idx == -1 or sig_idx is None:
-            if log: logger.warning(f'Unable to get the index of "{sig_name}"')
+            if log: logger.warning('Unable to get the index of "%s"', sig_name)
             return None
         fr_check, start_fr, end_fr = check_frame_range_valid(itf, start_frame, end_frame, log=log)
         if not fr_check:
@@ -1388,26 +1868,26 @@ def get_analog_data_unscaled(itf, sig_name, start_frame=None, end_frame=None, lo
             return None
         sig_format = get_analog_format(itf, log=log)
         is_sig_unsigned = (sig_format is not None) and (sig_format.upper()=='UNSIGNED')        
-        mkr_scale = get_marker_scale(itf, log=log)
-        if mkr_scale is None:
-            if log: logger.warning(f'Unable to get the marker scale factor')
+        is_c3d_float = _get_c3d_float_flag(itf, log=log)
+        if is_c3d_float is None:
+            if log: logger.warning('Unable to get the marker scale factor')
             return None        
-        is_c3d_float = mkr_scale < 0
-        is_c3d_float2 = [False, True][itf.GetDataType()-1]
-        if is_c3d_float != is_c3d_float2:
-            if log: logger.debug(f'C3D data type is determined by POINT:SCALE')
-        sig_dtype = [[np.int16, np.uint16][is_sig_unsigned], np.float32][is_c3d_float]
+        sig_dtype = np.float32 if is_c3d_float else (np.uint16 if is_sig_unsigned else np.int16)
         if start_fr == end_fr:
             av_ratio = get_analog_video_ratio(itf)
-            sig = np.zeros((av_ratio,), dtype=sig_dtype)
+            sig = np.empty((av_ratio,), dtype=sig_dtype)
             for i in range(av_ratio):
                 sig[i] = sig_dtype(itf.GetAnalogData(sig_idx, start_fr, i+1, '0', 0, 0, '0'))
         else:
-            sig = np.asarray(itf.GetAnalogDataEx(sig_idx, start_fr, end_fr, '0', 0, 0, '0'), dtype=sig_dtype)
+            n_sig_samples = (end_fr-start_fr+1)*get_analog_video_ratio(itf, log=log)
+            sig = _com_to_array(itf.GetAnalogDataEx(sig_idx, start_fr, end_fr, '0', 0, 0, '0'), sig_dtype, n_sig_samples)
         return sig
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise    
+    except ValueError as err:
+        if log: logger.error(err)
+        raise
 
 def get_analog_data_scaled(itf, sig_name, start_frame=None, end_frame=None, log=False):
     """
@@ -1435,7 +1915,7 @@ def get_analog_data_scaled(itf, sig_name, start_frame=None, end_frame=None, log=
     try:
         sig_idx = get_analog_index(itf, sig_name, log=log)
         if sig_idx == -1 or sig_idx is None:
-            if log: logger.warning(f'Unable to get the index of "{sig_name}"')
+            if log: logger.warning('Unable to get the index of "%s"', sig_name)
             return None
         fr_check, start_fr, end_fr = check_frame_range_valid(itf, start_frame, end_frame, log=log)
         if not fr_check:
@@ -1443,15 +1923,19 @@ def get_analog_data_scaled(itf, sig_name, start_frame=None, end_frame=None, log=
             return None
         if start_fr == end_fr:
             av_ratio = get_analog_video_ratio(itf)
-            sig = np.zeros((av_ratio,), dtype=np.float32)
+            sig = np.empty((av_ratio,), dtype=np.float32)
             for i in range(av_ratio):
                 sig[i] = np.float32(itf.GetAnalogData(sig_idx, start_fr, i+1, '1', 0, 0, '0'))
         else:
-            sig = np.asarray(itf.GetAnalogDataEx(sig_idx, start_fr, end_fr, '1', 0, 0, '0'), dtype=np.float32)
+            n_sig_samples = (end_fr-start_fr+1)*get_analog_video_ratio(itf, log=log)
+            sig = _com_to_array(itf.GetAnalogDataEx(sig_idx, start_fr, end_fr, '1', 0, 0, '0'), np.float32, n_sig_samples)
         return sig
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise    
+    except ValueError as err:
+        if log: logger.error(err)
+        raise
 
 def get_analog_data_scaled2(itf, sig_name, start_frame=None, end_frame=None, log=False):
     """
@@ -1479,7 +1963,7 @@ def get_analog_data_scaled2(itf, sig_name, start_frame=None, end_frame=None, log
     try:
         sig_idx = get_analog_index(itf, sig_name, log=log)
         if sig_idx == -1 or sig_idx is None:
-            if log: logger.warning(f'Unable to get the index of "{sig_name}"')
+            if log: logger.warning('Unable to get the index of "%s"', sig_name)
             return None
         fr_check, start_fr, end_fr = check_frame_range_valid(itf, start_frame, end_frame, log=log)
         if not fr_check:
@@ -1490,16 +1974,22 @@ def get_analog_data_scaled2(itf, sig_name, start_frame=None, end_frame=None, log
         sig_offset = np.float32(get_analog_offset(itf, sig_name, log=log))
         if start_fr == end_fr:
             av_ratio = get_analog_video_ratio(itf)
-            sig_data = np.zeros((av_ratio,), dtype=np.float32)
+            sig_data = np.empty((av_ratio,), dtype=np.float32)
             for i in range(av_ratio):
                 sig_data[i] = np.float32(itf.GetAnalogData(sig_idx, start_fr, i+1, '0', 0, 0, '0'))
         else:
-            sig_data = np.asarray(itf.GetAnalogDataEx(sig_idx, start_fr, end_fr, '0', 0, 0, '0'), dtype=np.float32)
-        sig = (sig_data-sig_offset)*sig_scale*gen_scale
+            n_sig_samples = (end_fr-start_fr+1)*get_analog_video_ratio(itf, log=log)
+            sig_data = _com_to_array(itf.GetAnalogDataEx(sig_idx, start_fr, end_fr, '0', 0, 0, '0'), np.float32, n_sig_samples)
+        sig = sig_data
+        sig -= sig_offset
+        sig *= sig_scale*gen_scale
         return sig
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise
+    except ValueError as err:
+        if log: logger.error(err)
+        raise
         
 def get_group_params(itf, grp_name, par_names, desc=False, log=False):
     """
@@ -1537,11 +2027,12 @@ def get_group_params(itf, grp_name, par_names, desc=False, log=False):
     """
     try:
         dict_dtype = {-1:str, 1:np.int8, 2:np.int32, 4:np.float32}
+        get_par_val = itf.GetParameterValue
         dict_info = {}
         for name in par_names:
             par_idx = itf.GetParameterIndex(grp_name, name)
             if par_idx == -1:
-                if log: logger.warning(f'{grp_name}:{name} does not exist')
+                if log: logger.warning('%s:%s does not exist', grp_name, name)
                 continue
             par_name = itf.GetParameterName(par_idx)
             if desc:
@@ -1551,17 +2042,16 @@ def get_group_params(itf, grp_name, par_names, desc=False, log=False):
             data_type = dict_dtype.get(par_type, None)
             par_num_dim = itf.GetParameterNumberDim(par_idx)
             par_dim = [itf.GetParameterDimension(par_idx, j) for j in range(par_num_dim)]
-            par_data = []
             # special handling for 'ANALOG:OFFSET' parameter
             if grp_name=='ANALOG' and par_name=='OFFSET':
                 sig_format = get_analog_format(itf, log=log)
                 is_sig_unsigned = (sig_format is not None) and (sig_format.upper()=='UNSIGNED')
-                pre_dtype = [np.int16, np.uint16][is_sig_unsigned]
-                for j in range(par_len):
-                    par_data.append(pre_dtype(itf.GetParameterValue(par_idx, j)))
+                pre_dtype = np.uint16 if is_sig_unsigned else np.int16
+                par_data = np.fromiter((get_par_val(par_idx, j) for j in range(par_len)), dtype=np.int64, count=par_len).astype(pre_dtype)
+            elif par_type == -1 or data_type is None:
+                par_data = [get_par_val(par_idx, j) for j in range(par_len)]
             else:
-                for j in range(par_len):
-                    par_data.append(itf.GetParameterValue(par_idx, j))
+                par_data = np.fromiter((get_par_val(par_idx, j) for j in range(par_len)), dtype=data_type, count=par_len)
             if par_type == -1:
                 # if len(par_data) == 1:
                 if par_num_dim <= 1:
@@ -1610,7 +2100,7 @@ def get_dict_header(itf, log=False):
         dict_data_type = {1:'INTEGER', 2:'REAL'}
         dict_header = {}
         dict_header['FILE_TYPE'] = dict_file_type.get(itf.GetFileType(), None)
-        dict_header['DATA_TYPE'] = dict_data_type.get(itf.GetDataType(), None)
+        dict_header['DATA_TYPE'] = dict_data_type.get(_get_cached(itf, 'data_type', itf.GetDataType), None)
         dict_header['NUM_3D_POINTS'] = np.int32(itf.GetNumber3DPoints())
         dict_header['NUM_ANALOG_CHANNELS'] = np.int32(itf.GetAnalogChannels())
         dict_header['FIRST_FRAME'] = np.int32(itf.GetVideoFrameHeader(0))
@@ -1661,6 +2151,7 @@ def get_dict_groups(itf, desc=False, tgt_grp_names=None, log=False):
     """
     try:
         dict_dtype = {-1:str, 1:np.int8, 2:np.int32, 4:np.float32}
+        get_par_val = itf.GetParameterValue
         dict_grps = {}
         dict_grp_names = {}
         n_grps = itf.GetNumberGroups()
@@ -1668,7 +2159,7 @@ def get_dict_groups(itf, desc=False, tgt_grp_names=None, log=False):
             grp_name = itf.GetGroupName(i)
             if (tgt_grp_names is not None) and (grp_name not in tgt_grp_names): continue
             grp_number = itf.GetGroupNumber(i)
-            dict_grp_names.update({np.absolute(grp_number, dtype=int): grp_name})
+            dict_grp_names[abs(grp_number)] = grp_name
             dict_grps[grp_name] = {}
         n_params = itf.GetNumberParameters()
         for i in range(n_params):
@@ -1684,17 +2175,16 @@ def get_dict_groups(itf, desc=False, tgt_grp_names=None, log=False):
             data_type = dict_dtype.get(par_type, None)
             par_num_dim = itf.GetParameterNumberDim(i)
             par_dim = [itf.GetParameterDimension(i, j) for j in range(par_num_dim)]
-            par_data = []
             # special handling for 'ANALOG:OFFSET' parameter
             if grp_name=='ANALOG' and par_name=='OFFSET':
                 sig_format = get_analog_format(itf, log=log)
                 is_sig_unsigned = (sig_format is not None) and (sig_format.upper()=='UNSIGNED')
-                pre_dtype = [np.int16, np.uint16][is_sig_unsigned]
-                for j in range(par_len):
-                    par_data.append(pre_dtype(itf.GetParameterValue(i, j)))
+                pre_dtype = np.uint16 if is_sig_unsigned else np.int16
+                par_data = np.fromiter((get_par_val(i, j) for j in range(par_len)), dtype=np.int64, count=par_len).astype(pre_dtype)
+            elif par_type == -1 or data_type is None:
+                par_data = [get_par_val(i, j) for j in range(par_len)]
             else:
-                for j in range(par_len):
-                    par_data.append(itf.GetParameterValue(i, j))
+                par_data = np.fromiter((get_par_val(i, j) for j in range(par_len)), dtype=data_type, count=par_len)
             if par_type == -1:
                 # if len(par_data) == 1:
                 if par_num_dim <= 1:
@@ -1758,13 +2248,8 @@ def get_dict_markers(itf, blocked_nan=False, resid=False, mask=False, desc=False
         start_fr = get_first_frame(itf, log=log)
         end_fr = get_last_frame(itf, log=log) 
         n_frs = end_fr-start_fr+1
-        idx_pt_labels = itf.GetParameterIndex('POINT', 'LABELS')
-        if idx_pt_labels == -1:
-            if log: logger.warning('POINT:LABELS does not exist')
-            return None
-        n_pt_labels = itf.GetParameterLength(idx_pt_labels)
-        if n_pt_labels < 1:
-            if log: logger.warning('No item under POINT:LABELS')
+        idx_pt_labels, n_pt_labels = _resolve_param(itf, 'POINT', 'LABELS', log=log)
+        if idx_pt_labels is None:
             return None
         idx_pt_used = itf.GetParameterIndex('POINT', 'USED')
         if idx_pt_used == -1:
@@ -1787,31 +2272,41 @@ def get_dict_markers(itf, blocked_nan=False, resid=False, mask=False, desc=False
         dict_pts['DATA'].update({'POS':{}})
         if resid: dict_pts['DATA'].update({'RESID': {}})
         if mask: dict_pts['DATA'].update({'MASK': {}})
+        get_par_val = itf.GetParameterValue
+        get_pt_data = itf.GetPointDataEx
+        get_pt_resid = itf.GetPointResidualEx
+        get_pt_mask = itf.GetPointMaskEx
+        # transient residual buffer shared by all markers; only the returned arrays are allocated per marker
+        if blocked_nan and not resid:
+            mkr_resid_buf = np.empty((n_frs,), dtype=np.float32)
+        pt_labels, _ = _get_point_labels(itf, log=log)
         for i in range(n_pt_labels):
             if i < n_pt_used:
-                mkr_name = itf.GetParameterValue(idx_pt_labels, i)
+                mkr_name = pt_labels[i]
                 if (tgt_mkr_names is not None) and (mkr_name not in tgt_mkr_names): continue
                 mkr_names.append(mkr_name)
-                mkr_data = np.zeros((n_frs, 3), dtype=np.float32)
+                mkr_data = np.empty((n_frs, 3), dtype=np.float32)
                 for j in range(3):
-                    mkr_data[:,j] = np.asarray(itf.GetPointDataEx(i, j, start_fr, end_fr, '1'), dtype=np.float32)
-                if blocked_nan or resid:
-                    mkr_resid = np.asarray(itf.GetPointResidualEx(i, start_fr, end_fr), dtype=np.float32)
+                    mkr_data[:,j] = _com_to_array(get_pt_data(i, j, start_fr, end_fr, '1'), np.float32, n_frs)
+                if resid:
+                    mkr_resid = _com_to_array(get_pt_resid(i, start_fr, end_fr), np.float32, n_frs)
+                elif blocked_nan:
+                    mkr_resid = mkr_resid_buf
+                    mkr_resid[:] = get_pt_resid(i, start_fr, end_fr)
                 if blocked_nan:
-                    mkr_null_masks = np.where(np.isclose(mkr_resid, -1), True, False)
-                    mkr_data[mkr_null_masks,:] = np.nan
+                    _finalize_marker_pos(mkr_data, mkr_resid=mkr_resid)
                 dict_pts['DATA']['POS'].update({mkr_name: mkr_data})
                 if resid:
                     dict_pts['DATA']['RESID'].update({mkr_name: mkr_resid})
                 if mask:
-                    mkr_mask = np.asarray(itf.GetPointMaskEx(i, start_fr, end_fr), dtype=str)
+                    mkr_mask = _to_str_array(get_pt_mask(i, start_fr, end_fr))
                     dict_pts['DATA']['MASK'].update({mkr_name: mkr_mask})
                 if desc:
                     if i < n_pt_desc:
-                        mkr_descs.append(itf.GetParameterValue(idx_pt_desc, i))
+                        mkr_descs.append(get_par_val(idx_pt_desc, i))
                     else:
                         mkr_descs.append('')
-        dict_pts.update({'LABELS': np.asarray(mkr_names, dtype=str)})
+        dict_pts.update({'LABELS': _to_str_array(mkr_names)})
         idx_pt_rate = itf.GetParameterIndex('POINT', 'RATE')
         if idx_pt_rate != -1:
             n_pt_rate = itf.GetParameterLength(idx_pt_rate)
@@ -1826,13 +2321,16 @@ def get_dict_markers(itf, blocked_nan=False, resid=False, mask=False, desc=False
                 dict_pts.update({'UNITS': unit})
         if desc:
             if idx_pt_desc != -1:
-                dict_pts.update({'DESCRIPTIONS': np.asarray(mkr_descs, dtype=str)})
+                dict_pts.update({'DESCRIPTIONS': _to_str_array(mkr_descs)})
         if frame: dict_pts.update({'FRAME': get_video_frames(itf, log=log)})
         if time: dict_pts.update({'TIME': get_video_times(itf, log=log)})
         return dict_pts
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise
+    except ValueError as err:
+        if log: logger.error(err)
+        raise
 
 def get_dict_analogs(itf, desc=False, frame=False, time=False, excl_forces=True, log=False):
     """
@@ -1864,10 +2362,11 @@ def get_dict_analogs(itf, desc=False, frame=False, time=False, excl_forces=True,
     try:
         start_fr = get_first_frame(itf, log=log)
         end_fr = get_last_frame(itf, log=log)
+        n_sig_samples = (end_fr-start_fr+1)*get_analog_video_ratio(itf, log=log)
         n_force_chs = 0
-        idx_force_chs = itf.GetParameterIndex('FORCE_PLATFORM', 'CHANNEL')
+        idx_force_chs = _get_param_index(itf, 'FORCE_PLATFORM', 'CHANNEL')
         if idx_force_chs == -1: 
-            if log: logger.warning(f'FORCE_PLATFORM:CHANNEL does not exist')
+            if log: logger.warning('FORCE_PLATFORM:CHANNEL does not exist')
             n_force_chs = 0
         else:
             n_force_chs = itf.GetParameterLength(idx_force_chs)
@@ -1876,86 +2375,97 @@ def get_dict_analogs(itf, desc=False, frame=False, time=False, excl_forces=True,
             for i in range(n_force_chs):
                 ch_idx = itf.GetParameterValue(idx_force_chs, i)-1
                 force_ch_idx.append(ch_idx)
-        idx_analog_labels = itf.GetParameterIndex('ANALOG', 'LABELS')
-        if idx_analog_labels == -1:
-            if log: logger.warning('ANALOG:LABELS does not exist')
+        idx_analog_labels, n_analog_labels = _resolve_param(itf, 'ANALOG', 'LABELS', log=log)
+        if idx_analog_labels is None:
             return None
-        n_analog_labels = itf.GetParameterLength(idx_analog_labels)
-        if n_analog_labels < 1:
-            if log: logger.warning('No item under ANALOG:LABELS')
-            return None    
-        idx_analog_used = itf.GetParameterIndex('ANALOG', 'USED')
+        idx_analog_used = _get_param_index(itf, 'ANALOG', 'USED')
         if idx_analog_used == -1:
             if log: logger.warning('ANALOG:USED does not exist')
             return None
         n_analog_used = itf.GetParameterValue(idx_analog_used, 0)
         if n_analog_used < 1:
-            if log: logger.warning(f'ANALOG:USED is zero')
+            if log: logger.warning('ANALOG:USED is zero')
             return None    
-        idx_analog_scale = itf.GetParameterIndex('ANALOG', 'SCALE')
+        idx_analog_scale = _get_param_index(itf, 'ANALOG', 'SCALE')
         if idx_analog_scale == -1:
             if log: logger.warning('ANALOG:SCALE does not exist')
             return None       
-        idx_analog_offset = itf.GetParameterIndex('ANALOG', 'OFFSET')
+        idx_analog_offset = _get_param_index(itf, 'ANALOG', 'OFFSET')
         if idx_analog_offset == -1:
             if log: logger.warning('ANALOG:OFFSET does not exist')
             return None
-        idx_analog_units = itf.GetParameterIndex('ANALOG', 'UNITS')
+        idx_analog_units = _get_param_index(itf, 'ANALOG', 'UNITS')
         if idx_analog_units == -1:
             if log: logger.warning('ANALOG:UNITS does not exist')
-            n_analog_units = 0
-        else:
-            n_analog_units = itf.GetParameterLength(idx_analog_units)
-        idx_analog_desc = itf.GetParameterIndex('ANALOG', 'DESCRIPTIONS')
-        if idx_analog_desc == -1:
-            if log: logger.warning('ANALOG:DESCRIPTIONS does not exist')
-            n_analog_desc = 0
-        else:
-            n_analog_desc = itf.GetParameterLength(idx_analog_desc)
+        anl_units = _get_param_values(itf, 'ANALOG', 'UNITS')
+        n_analog_units = len(anl_units)
+        if desc:
+            idx_analog_desc = _get_param_index(itf, 'ANALOG', 'DESCRIPTIONS')
+            if idx_analog_desc == -1:
+                if log: logger.warning('ANALOG:DESCRIPTIONS does not exist')
+            anl_descs = _get_param_values(itf, 'ANALOG', 'DESCRIPTIONS')
+            n_analog_desc = len(anl_descs)
         gen_scale = get_analog_gen_scale(itf, log=log)
         sig_format = get_analog_format(itf, log=log)
         is_sig_unsigned = (sig_format is not None) and (sig_format.upper()=='UNSIGNED')
-        offset_dtype = [np.int16, np.uint16][is_sig_unsigned]    
+        offset_dtype = np.uint16 if is_sig_unsigned else np.int16
         dict_analogs = {}
         analog_names = []
         analog_units = []
         analog_descs = []
         dict_analogs.update({'DATA':{}})
-        for i in range(n_analog_labels):
-            if i < n_analog_used:
-                if i in force_ch_idx: continue
-                sig_name = itf.GetParameterValue(idx_analog_labels, i)
-                analog_names.append(sig_name)
-                sig_scale = np.float32(itf.GetParameterValue(idx_analog_scale, i))
-                sig_offset = np.float32(offset_dtype(itf.GetParameterValue(idx_analog_offset, i)))
-                sig_val = (np.asarray(itf.GetAnalogDataEx(i, start_fr, end_fr, '0', 0, 0, '0'), dtype=np.float32)-sig_offset)*sig_scale*gen_scale
-                dict_analogs['DATA'].update({sig_name: sig_val})
-                if i < n_analog_units:
-                    analog_units.append(itf.GetParameterValue(idx_analog_units, i))
+        get_anl_data = itf.GetAnalogDataEx
+        anl_labels, _ = _get_analog_labels(itf, log=log)
+        sig_idxs = [i for i in range(min(n_analog_labels, n_analog_used)) if i not in force_ch_idx]
+        n_sigs = len(sig_idxs)
+        anl_offsets = _get_param_values(itf, 'ANALOG', 'OFFSET')
+        anl_scales = _get_param_values(itf, 'ANALOG', 'SCALE')
+        n_sig_items = sig_idxs[-1]+1 if n_sigs > 0 else 0
+        if len(anl_offsets) < n_sig_items:
+            err_msg = f'ANALOG:OFFSET has {len(anl_offsets)} items, but {n_sig_items} are needed'
+            raise ValueError(err_msg)
+        if len(anl_scales) < n_sig_items:
+            err_msg = f'ANALOG:SCALE has {len(anl_scales)} items, but {n_sig_items} are needed'
+            raise ValueError(err_msg)
+        sig_offsets = np.fromiter((anl_offsets[i] for i in sig_idxs), dtype=np.int64, count=n_sigs).astype(offset_dtype).astype(np.float32)
+        sig_scales = np.fromiter((anl_scales[i] for i in sig_idxs), dtype=np.float32, count=n_sigs)
+        sig_scales *= gen_scale
+        # one contiguous (n_channels, n_samples) buffer; each 'DATA' entry is a row view of it
+        sig_buf = np.empty((n_sigs, n_sig_samples), dtype=np.float32)
+        for row, i in enumerate(sig_idxs):
+            sig_name = anl_labels[i]
+            analog_names.append(sig_name)
+            sig_val = _fetch_and_scale_analog(get_anl_data, i, start_fr, end_fr, n_sig_samples, sig_offsets[row], sig_scales[row], out=sig_buf[row])
+            dict_analogs['DATA'].update({sig_name: sig_val})
+            if i < n_analog_units:
+                analog_units.append(anl_units[i])
+            else:
+                analog_units.append('')
+            if desc:
+                if i < n_analog_desc:
+                    analog_descs.append(anl_descs[i])
                 else:
-                    analog_units.append('')
-                if desc:
-                    if i < n_analog_desc:
-                        analog_descs.append(itf.GetParameterValue(idx_analog_desc, i))
-                    else:
-                        analog_descs.append('')
-        dict_analogs.update({'LABELS': np.asarray(analog_names, dtype=str)})
-        idx_analog_rate = itf.GetParameterIndex('ANALOG', 'RATE')
+                    analog_descs.append('')
+        dict_analogs.update({'LABELS': _to_str_array(analog_names)})
+        idx_analog_rate = _get_param_index(itf, 'ANALOG', 'RATE')
         if idx_analog_rate != -1:
             n_analog_rate = itf.GetParameterLength(idx_analog_rate)
             if n_analog_rate == 1:
                 dict_analogs.update({'RATE': np.float32(itf.GetParameterValue(idx_analog_rate, 0))})
         if idx_analog_units != -1:
-            dict_analogs.update({'UNITS': np.asarray(analog_units, dtype=str)})
+            dict_analogs.update({'UNITS': _to_str_array(analog_units)})
         if desc:
             if idx_analog_desc != -1:
-                dict_analogs.update({'DESCRIPTIONS': np.asarray(analog_descs, dtype=str)})
+                dict_analogs.update({'DESCRIPTIONS': _to_str_array(analog_descs)})
         if frame: dict_analogs.update({'FRAME': get_analog_frames(itf, log=log)})
         if time: dict_analogs.update({'TIME': get_analog_times(itf, log=log)})
         return dict_analogs
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise    
+    except ValueError as err:
+        if log: logger.error(err)
+        raise
     
 def get_dict_forces(itf, desc=False, frame=False, time=False, log=False):
     """
@@ -1985,86 +2495,104 @@ def get_dict_forces(itf, desc=False, frame=False, time=False, log=False):
     try:
         start_fr = get_first_frame(itf, log=log)
         end_fr = get_last_frame(itf, log=log)
-        idx_fp_used = itf.GetParameterIndex('FORCE_PLATFORM', 'USED')
+        n_sig_samples = (end_fr-start_fr+1)*get_analog_video_ratio(itf, log=log)
+        idx_fp_used = _get_param_index(itf, 'FORCE_PLATFORM', 'USED')
         if idx_fp_used == -1: 
-            if log: logger.warning(f'FORCE_PLATFORM:USED does not exist')
+            if log: logger.warning('FORCE_PLATFORM:USED does not exist')
             return None
         n_fp_used = itf.GetParameterValue(idx_fp_used, 0)
         if n_fp_used < 1:
-            if log: logger.warning(f'FORCE_PLATFORM:USED is zero')
+            if log: logger.warning('FORCE_PLATFORM:USED is zero')
             return None
-        idx_force_chs = itf.GetParameterIndex('FORCE_PLATFORM', 'CHANNEL')
+        idx_force_chs = _get_param_index(itf, 'FORCE_PLATFORM', 'CHANNEL')
         if idx_force_chs == -1: 
-            if log: logger.warning(f'FORCE_PLATFORM:CHANNEL does not exist')
+            if log: logger.warning('FORCE_PLATFORM:CHANNEL does not exist')
             return None
-        idx_analog_labels = itf.GetParameterIndex('ANALOG', 'LABELS')
+        idx_analog_labels = _get_param_index(itf, 'ANALOG', 'LABELS')
         if idx_analog_labels == -1:
             if log: logger.warning('ANALOG:LABELS does not exist')
             return None       
-        idx_analog_scale = itf.GetParameterIndex('ANALOG', 'SCALE')
+        idx_analog_scale = _get_param_index(itf, 'ANALOG', 'SCALE')
         if idx_analog_scale == -1:
             if log: logger.warning('ANALOG:SCALE does not exist')
             return None     
-        idx_analog_offset = itf.GetParameterIndex('ANALOG', 'OFFSET')
+        idx_analog_offset = _get_param_index(itf, 'ANALOG', 'OFFSET')
         if idx_analog_offset == -1:
             if log: logger.warning('ANALOG:OFFSET does not exist')
             return None
-        idx_analog_units = itf.GetParameterIndex('ANALOG', 'UNITS')
+        idx_analog_units = _get_param_index(itf, 'ANALOG', 'UNITS')
         if idx_analog_units == -1:
             if log: logger.warning('ANALOG:UNITS does not exist')
-            n_analog_units = 0
-        else:
-            n_analog_units = itf.GetParameterLength(idx_analog_units)
-        idx_analog_desc = itf.GetParameterIndex('ANALOG', 'DESCRIPTIONS')
-        if idx_analog_desc == -1:
-            if log: logger.warning('ANALOG:DESCRIPTIONS does not exist')
-            n_analog_desc = 0
-        else:
-            n_analog_desc = itf.GetParameterLength(idx_analog_desc)
+        anl_units = _get_param_values(itf, 'ANALOG', 'UNITS')
+        n_analog_units = len(anl_units)
+        if desc:
+            idx_analog_desc = _get_param_index(itf, 'ANALOG', 'DESCRIPTIONS')
+            if idx_analog_desc == -1:
+                if log: logger.warning('ANALOG:DESCRIPTIONS does not exist')
+            anl_descs = _get_param_values(itf, 'ANALOG', 'DESCRIPTIONS')
+            n_analog_desc = len(anl_descs)
         gen_scale = get_analog_gen_scale(itf, log=log)
         sig_format = get_analog_format(itf, log=log)
         is_sig_unsigned = (sig_format is not None) and (sig_format.upper()=='UNSIGNED')
-        offset_dtype = [np.int16, np.uint16][is_sig_unsigned]
+        offset_dtype = np.uint16 if is_sig_unsigned else np.int16
+        get_par_val = itf.GetParameterValue
+        ch_scales = np.array(_get_param_values(itf, 'ANALOG', 'SCALE'), dtype=np.float32)
+        ch_offsets = np.array(_get_param_values(itf, 'ANALOG', 'OFFSET'), dtype=np.int64).astype(offset_dtype).astype(np.float32)
         dict_forces = {}
         force_names = []
         force_units = []
         force_descs = []
         dict_forces.update({'DATA':{}})
+        get_anl_data = itf.GetAnalogDataEx
+        anl_labels, _ = _get_analog_labels(itf, log=log)
+        n_anl_labels_used = 0 if anl_labels is None else len(anl_labels)
         n_force_chs = itf.GetParameterLength(idx_force_chs)
         for i in range(n_force_chs):
-            ch_idx = itf.GetParameterValue(idx_force_chs, i)-1
-            ch_name = itf.GetParameterValue(idx_analog_labels, ch_idx)
+            ch_idx = get_par_val(idx_force_chs, i)-1
+            if ch_idx < n_anl_labels_used:
+                ch_name = anl_labels[ch_idx]
+            else:
+                ch_name = get_par_val(idx_analog_labels, ch_idx)
             force_names.append(ch_name)
-            ch_scale = np.float32(itf.GetParameterValue(idx_analog_scale, ch_idx))
-            ch_offset = np.float32(offset_dtype(itf.GetParameterValue(idx_analog_offset, ch_idx)))
-            ch_val = (np.asarray(itf.GetAnalogDataEx(ch_idx, start_fr, end_fr, '0', 0, 0, '0'), dtype=np.float32)-ch_offset)*ch_scale*gen_scale
+            if ch_idx >= len(ch_offsets):
+                err_msg = f'ANALOG:OFFSET has no item for the force channel {ch_idx+1}'
+                raise ValueError(err_msg)
+            if ch_idx >= len(ch_scales):
+                err_msg = f'ANALOG:SCALE has no item for the force channel {ch_idx+1}'
+                raise ValueError(err_msg)
+            ch_scale = ch_scales[ch_idx]
+            ch_offset = ch_offsets[ch_idx]
+            ch_val = _fetch_and_scale_analog(get_anl_data, ch_idx, start_fr, end_fr, n_sig_samples, ch_offset, ch_scale*gen_scale)
             dict_forces['DATA'].update({ch_name: ch_val})
             if ch_idx < n_analog_units:
-                force_units.append(itf.GetParameterValue(idx_analog_units, ch_idx))
+                force_units.append(anl_units[ch_idx])
             else:
                 force_units.append('')
             if desc:
                 if ch_idx < n_analog_desc:
-                    force_descs.append(itf.GetParameterValue(idx_analog_desc, ch_idx))
+                    force_descs.append(anl_descs[ch_idx])
                 else:
                     force_descs.append('')
-        dict_forces.update({'LABELS': np.asarray(force_names, dtype=str)})
-        idx_analog_rate = itf.GetParameterIndex('ANALOG', 'RATE')
+        dict_forces.update({'LABELS': _to_str_array(force_names)})
+        idx_analog_rate = _get_param_index(itf, 'ANALOG', 'RATE')
         if idx_analog_rate != -1:
             n_analog_rate = itf.GetParameterLength(idx_analog_rate)
             if n_analog_rate == 1:
                 dict_forces.update({'RATE': np.float32(itf.GetParameterValue(idx_analog_rate, 0))})
         if idx_analog_units != -1:
-            dict_forces.update({'UNITS': np.asarray(force_units, dtype=str)})
+            dict_forces.update({'UNITS': _to_str_array(force_units)})
         if desc:
             if idx_analog_desc != -1:
-                dict_forces.update({'DESCRIPTIONS': np.asarray(force_descs, dtype=str)})
+                dict_forces.update({'DESCRIPTIONS': _to_str_array(force_descs)})
         if frame: dict_forces.update({'FRAME': get_analog_frames(itf, log=log)})
         if time: dict_forces.update({'TIME': get_analog_times(itf, log=log)})
         return dict_forces
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise
+    except ValueError as err:
+        if log: logger.error(err)
+        raise
         
 def get_fp_params(itf, log=False):
     """
@@ -2130,6 +2658,8 @@ def get_fp_output(itf, threshold=0.0, filt_fc=None, filt_order=2, cop_nan_to_num
     try:
         start_fr = get_first_frame(itf, log=log)
         end_fr = get_last_frame(itf, log=log)
+        n_sig_samples = (end_fr-start_fr+1)*get_analog_video_ratio(itf, log=log)
+        get_anl_data = itf.GetAnalogDataEx
         idx_fp_used = itf.GetParameterIndex('FORCE_PLATFORM', 'USED')
         if idx_fp_used == -1: 
             if log: logger.warning('FORCE_PLATFORM:USED does not exist')
@@ -2217,7 +2747,7 @@ def get_fp_output(itf, threshold=0.0, filt_fc=None, filt_order=2, cop_nan_to_num
             gen_scale = get_analog_gen_scale(itf, log=log)
             sig_format = get_analog_format(itf, log=log)
             is_sig_unsigned = (sig_format is not None) and (sig_format.upper()=='UNSIGNED')
-            sig_offset_dtype = [np.int16, np.uint16][is_sig_unsigned]
+            sig_offset_dtype = np.uint16 if is_sig_unsigned else np.int16
             if filt_fc is None:
                 filt_fcs = [None]*len(chs)
             elif type(filt_fc) in [int, float]:
@@ -2237,7 +2767,7 @@ def get_fp_output(itf, threshold=0.0, filt_fc=None, filt_order=2, cop_nan_to_num
                     ch_unit = itf.GetParameterValue(idx_analog_units, ch_idx)
                 ch_scale = np.float32(itf.GetParameterValue(idx_analog_scale, ch_idx))
                 ch_offset = np.float32(sig_offset_dtype(itf.GetParameterValue(idx_analog_offset, ch_idx)))
-                ch_val = (np.asarray(itf.GetAnalogDataEx(ch_idx, start_fr, end_fr, '0', 0, 0, '0'), dtype=np.float32)-ch_offset)*ch_scale*gen_scale
+                ch_val = _fetch_and_scale_analog(get_anl_data, ch_idx, start_fr, end_fr, n_sig_samples, ch_offset, ch_scale*gen_scale)
                 # assign channel names
                 if fp_type == 1:
                     # assume that the order of input analog channels are as follows:
@@ -2370,6 +2900,9 @@ def get_fp_output(itf, threshold=0.0, filt_fc=None, filt_order=2, cop_nan_to_num
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise
+    except ValueError as err:
+        if log: logger.error(err)
+        raise
     
 def change_marker_name(itf, mkr_name_old, mkr_name_new, log=False):
     """
@@ -2397,14 +2930,14 @@ def change_marker_name(itf, mkr_name_old, mkr_name_new, log=False):
         if mkr_idx == -1 or mkr_idx is None:
             err_msg = f'Unable to get the index of "{mkr_name_old}"'
             raise ValueError(err_msg)
-        par_idx = itf.GetParameterIndex('POINT', 'LABELS')
+        par_idx = _get_param_index(itf, 'POINT', 'LABELS')
         if par_idx == -1:
             err_msg = 'POINT:LABELS does not exist'
             raise RuntimeError(err_msg)
         ret = itf.SetParameterValue(par_idx, mkr_idx, mkr_name_new)
         if log:
-            logger.info(f'Changing the marker name from "{mkr_name_old}" to "{mkr_name_new}": {["FAILURE", "SUCCESS"][ret]}')
-        return [False, True][ret]
+            logger.info('Changing the marker name from "%s" to "%s": %s', mkr_name_old, mkr_name_new, "SUCCESS" if ret else "FAILURE")
+        return bool(ret)
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise
@@ -2413,7 +2946,9 @@ def change_marker_name(itf, mkr_name_old, mkr_name_new, log=False):
         raise
     except RuntimeError as err:
         if log: logger.error(err)
-        raise        
+        raise
+    finally:
+        _clear_itf_cache(itf)
 
 def change_analog_name(itf, sig_name_old, sig_name_new, log=False):
     """
@@ -2441,14 +2976,14 @@ def change_analog_name(itf, sig_name_old, sig_name_new, log=False):
         if sig_idx == -1 or sig_idx is None:
             err_msg = f'Unable to get the index of "{sig_name_old}"'
             raise ValueError(err_msg)
-        par_idx = itf.GetParameterIndex('ANALOG', 'LABELS')
+        par_idx = _get_param_index(itf, 'ANALOG', 'LABELS')
         if par_idx == -1:
             err_msg = 'ANALOG:LABELS does not exist'
             raise RuntimeError(err_msg)
         ret = itf.SetParameterValue(par_idx, sig_idx, sig_name_new)
         if log:
-            logger.info(f'Changing the signal name from "{sig_name_old}" to "{sig_name_new}": {["FAILURE", "SUCCESS"][ret]}')    
-        return [False, True][ret]
+            logger.info('Changing the signal name from "%s" to "%s": %s', sig_name_old, sig_name_new, "SUCCESS" if ret else "FAILURE")
+        return bool(ret)
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise
@@ -2458,6 +2993,8 @@ def change_analog_name(itf, sig_name_old, sig_name_new, log=False):
     except RuntimeError as err:
         if log: logger.error(err)
         raise
+    finally:
+        _clear_itf_cache(itf)
 
 def resize_char_type_param(itf, grp_name, param_name, new_str_len, log=False):
     """
@@ -2513,7 +3050,7 @@ def resize_char_type_param(itf, grp_name, param_name, new_str_len, log=False):
         var_par_dim = win32.VARIANT(pythoncom.VT_ARRAY|pythoncom.VT_I2, par_dim)
         var_par_data = win32.VARIANT(pythoncom.VT_ARRAY|pythoncom.VT_BSTR, par_data)
         # Delete existing parameter
-        ret = [False, True][itf.DeleteParameter(idx_par)]
+        ret = bool(itf.DeleteParameter(idx_par))
         if not ret:
             err_msg = f'Failed to delete existing {grp_name}:{param_name}'
             raise RuntimeError(err_msg)             
@@ -2533,6 +3070,8 @@ def resize_char_type_param(itf, grp_name, param_name, new_str_len, log=False):
     except RuntimeError as err:
         if log: logger.error(err)
         raise
+    finally:
+        _clear_itf_cache(itf)
         
 def adjust_param_items(itf, grp_name, param_name, recreate_param=False, keep_str_len=True, log=False):
     """
@@ -2576,10 +3115,10 @@ def adjust_param_items(itf, grp_name, param_name, recreate_param=False, keep_str
             n_par = itf.GetParameterLength(idx_par)
             desc_len_max = itf.GetParameterDimension(idx_par, 0)
             if n_par == n_used:
-                if log: logger.debug(f'{grp_name}:{param_name} has as same number of items as {grp_name}:USED')
+                if log: logger.debug('%s:%s has as same number of items as %s:USED', grp_name, param_name, grp_name)
                 return False            
             elif n_par < n_used:
-                if log: logger.debug(f'{grp_name}:{param_name} has fewer items than {grp_name}:USED')
+                if log: logger.debug('%s:%s has fewer items than %s:USED', grp_name, param_name, grp_name)
                 # for i in range(n_par, n_used):
                 #     ret = itf.AddParameterData(idx_par, 1)
                 #     par_len = itf.GetParameterLength(idx_par)
@@ -2591,7 +3130,7 @@ def adjust_param_items(itf, grp_name, param_name, recreate_param=False, keep_str
                     var_desc = win32.VARIANT(pythoncom.VT_BSTR, str_desc)
                     ret = itf.SetParameterValue(idx_par, i, var_desc)                    
             else:
-                if log: logger.debug(f'{grp_name}:{param_name} has more items than {grp_name}:USED, so all unused items will be deleted')
+                if log: logger.debug('%s:%s has more items than %s:USED, so all unused items will be deleted', grp_name, param_name, grp_name)
                 if recreate_param:
                     par_desc = itf.GetParameterDescription(idx_par)
                     par_num_dim = itf.GetParameterNumberDim(idx_par)
@@ -2601,13 +3140,13 @@ def adjust_param_items(itf, grp_name, param_name, recreate_param=False, keep_str
                         par_data.append(itf.GetParameterValue(idx_par, i))
                     par_type = itf.GetParameterType(idx_par)
                     size_par_ideal = math.ceil(float(par_dim_old[0]*par_dim_old[1])/float(n_used))
-                    size_par = [size_par_ideal, par_dim_old[0]][keep_str_len]
+                    size_par = par_dim_old[0] if keep_str_len else size_par_ideal
                     par_dim = [size_par, n_used]
                     var_par_dim = win32.VARIANT(pythoncom.VT_ARRAY|pythoncom.VT_I2, par_dim)
                     # Use a pure python list of strings for pythoncom.VT_ARRAY|pythoncom.VT_BSTR instead of a ndarray
                     var_par_data = win32.VARIANT(pythoncom.VT_ARRAY|pythoncom.VT_BSTR, par_data)
                     # Delete existing parameter
-                    ret = [False, True][itf.DeleteParameter(idx_par)]
+                    ret = bool(itf.DeleteParameter(idx_par))
                     if not ret:
                         err_msg = f'Failed to delete existing {grp_name}:{param_name}'
                         raise RuntimeError(err_msg)
@@ -2631,13 +3170,13 @@ def adjust_param_items(itf, grp_name, param_name, recreate_param=False, keep_str
             idx_par = itf.GetParameterIndex(grp_name, param_name)
             n_par = itf.GetParameterLength(idx_par)
             if n_par == n_used:
-                if log: logger.debug(f'{grp_name}:{param_name} has as same number of items as {grp_name}:USED')
+                if log: logger.debug('%s:%s has as same number of items as %s:USED', grp_name, param_name, grp_name)
                 return False            
             elif n_par < n_used:
                 err_msg = f'Number of item under {grp_name}:{param_name} is less than {grp_name}:USED'
                 raise RuntimeError(err_msg)
             else:
-                if log: logger.debug(f'{grp_name}:{param_name} has more items than {grp_name}:USED, so all unused items will be deleted')
+                if log: logger.debug('%s:%s has more items than %s:USED, so all unused items will be deleted', grp_name, param_name, grp_name)
                 if recreate_param:
                     par_desc = itf.GetParameterDescription(idx_par)
                     par_num_dim = itf.GetParameterNumberDim(idx_par)
@@ -2648,7 +3187,7 @@ def adjust_param_items(itf, grp_name, param_name, recreate_param=False, keep_str
                     par_type = itf.GetParameterType(idx_par)
                     if par_type == -1:
                         size_par_ideal = math.ceil(float(par_dim_old[0]*par_dim_old[1])/float(n_used))
-                        size_par = [size_par_ideal, par_dim_old[0]][keep_str_len]
+                        size_par = par_dim_old[0] if keep_str_len else size_par_ideal
                         par_dim = [size_par, n_used]
                     else:
                         par_dim = [n_used]
@@ -2666,7 +3205,7 @@ def adjust_param_items(itf, grp_name, param_name, recreate_param=False, keep_str
                         err_msg = f'Unknown data type from {grp_name}:{param_name}'
                         raise RuntimeError(err_msg)              
                     # Delete existing parameter
-                    ret = [False, True][itf.DeleteParameter(idx_par)]
+                    ret = bool(itf.DeleteParameter(idx_par))
                     if not ret:
                         err_msg = f'Failed to delete existing {grp_name}:{param_name}'
                         raise RuntimeError(err_msg)             
@@ -2692,7 +3231,9 @@ def adjust_param_items(itf, grp_name, param_name, recreate_param=False, keep_str
         raise
     except RuntimeError as err:
         if log: logger.error(err)
-        raise          
+        raise
+    finally:
+        _clear_itf_cache(itf)
     
 def auto_adjust_params(itf, recreate_param=False, keep_str_len=True, log=False):
     """
@@ -2758,7 +3299,7 @@ def add_group(itf, grp_name, grp_desc=None, grp_lock=False, log=False):
     """
     try:
         desc = '' if grp_desc is None else grp_desc
-        lock = ['0', '1'][grp_lock]
+        lock = '1' if grp_lock else '0'
         ret = itf.AddGroup(0, grp_name, desc, lock)
         if ret == -1:
             err_msg = 'Group could not be added'
@@ -2770,7 +3311,9 @@ def add_group(itf, grp_name, grp_desc=None, grp_lock=False, log=False):
         raise
     except RuntimeError as err:
         if log: logger.error(err)
-        raise        
+        raise
+    finally:
+        _clear_itf_cache(itf)
 
 def add_param(itf, grp_name, param_name, param_data, param_desc=None, make_new_grp=False, log=False):
     """
@@ -2887,8 +3430,34 @@ def add_param(itf, grp_name, param_name, param_data, param_desc=None, make_new_g
         raise
     except RuntimeError as err:
         if log: logger.error(err)
-        raise        
+        raise
+    finally:
+        _clear_itf_cache(itf)
     
+def _encode_marker_coords(itf, mkr_coords, has_nan=True, log=False):
+    # marker coordinates in the storage type of the open file, with the matching VARIANT types
+    # ('has_nan=False' lets a caller that already checked the input skip the nan_to_num pass)
+    is_c3d_float = _get_c3d_float_flag(itf, log=log)
+    if is_c3d_float is None:
+        err_msg = f'Unable to get the marker scale factor'
+        raise RuntimeError(err_msg)
+    if is_c3d_float:
+        if has_nan:
+            mkr_coords_unscaled = np.nan_to_num(np.array(mkr_coords, dtype=np.float32), copy=False)
+        else:
+            mkr_coords_unscaled = np.asarray(mkr_coords, dtype=np.float32)
+        dtype = pythoncom.VT_R4
+    else:
+        scale_size = np.fabs(get_marker_scale(itf, log=log))
+        mkr_coords_buf = np.array(mkr_coords, dtype=np.result_type(mkr_coords, scale_size))
+        if has_nan:
+            np.nan_to_num(mkr_coords_buf, copy=False)
+        np.divide(mkr_coords_buf, scale_size, out=mkr_coords_buf)
+        np.round(mkr_coords_buf, out=mkr_coords_buf)
+        mkr_coords_unscaled = mkr_coords_buf.astype(np.int16)
+        dtype = pythoncom.VT_I2
+    return mkr_coords_unscaled, dtype, pythoncom.VT_ARRAY|dtype
+
 def add_marker(itf, mkr_name, mkr_coords, mkr_resid=None, mkr_desc=None, adjust_params=False, log=False):
     """
     Add a new marker into an open C3D file.
@@ -2919,7 +3488,7 @@ def add_marker(itf, mkr_name, mkr_coords, mkr_resid=None, mkr_desc=None, adjust_
 
     """
     try:
-        if log: logger.debug(f'Start adding a new "{mkr_name}" marker ...')
+        if log: logger.debug('Start adding a new "%s" marker ...', mkr_name)
         start_fr = get_first_frame(itf, log=log)
         n_frs = get_num_frames(itf, log=log)
         if not (mkr_coords.ndim==2 and mkr_coords.shape[0]==n_frs and mkr_coords.shape[1]==3):
@@ -2935,10 +3504,10 @@ def add_marker(itf, mkr_name, mkr_coords, mkr_resid=None, mkr_desc=None, adjust_
             adjust_param_items(itf, 'POINT', 'DESCRIPTIONS', recreate_param=False, keep_str_len=True, log=log)
         ret = 0
         # Check 'POINT:USED'
-        idx_pt_used = itf.GetParameterIndex('POINT', 'USED')
+        idx_pt_used = _get_param_index(itf, 'POINT', 'USED')
         n_pt_used_before = itf.GetParameterValue(idx_pt_used, 0)
         # Check 'POINT:LABELS'
-        idx_pt_labels = itf.GetParameterIndex('POINT', 'LABELS')
+        idx_pt_labels = _get_param_index(itf, 'POINT', 'LABELS')
         n_pt_labels_before = itf.GetParameterLength(idx_pt_labels)
         # Skip if 'POINT:USED' and 'POINT:LABELS' have different numbers
         if n_pt_used_before != n_pt_labels_before:
@@ -2958,7 +3527,7 @@ def add_marker(itf, mkr_name, mkr_coords, mkr_resid=None, mkr_desc=None, adjust_
             err_msg = f'Failed to set the value of an item under POINT:LABELS'
             raise RuntimeError(err_msg)
         # Add a null parameter in the 'POINT:DESCRIPTIONS' section
-        idx_pt_desc = itf.GetParameterIndex('POINT', 'DESCRIPTIONS')
+        idx_pt_desc = _get_param_index(itf, 'POINT', 'DESCRIPTIONS')
         ret = itf.AddParameterData(idx_pt_desc, 1)
         if ret == 0:
             err_msg = f'Failed to add an item under POINT:DESCRIPTIONS'
@@ -2974,26 +3543,9 @@ def add_marker(itf, mkr_name, mkr_coords, mkr_resid=None, mkr_desc=None, adjust_
         new_mkr_idx = itf.AddMarker()
         n_mkrs = itf.GetNumber3DPoints()
         mkr_null_masks = np.any(np.isnan(mkr_coords), axis=1)
-        mkr_resid_adjusted = np.zeros((n_frs, ), dtype=np.float32) if mkr_resid is None else np.array(mkr_resid, dtype=np.float32)
-        mkr_resid_adjusted[mkr_null_masks] = -1
-        # mkr_masks = np.array(['0000000']*n_frs, dtype = np.string_)
+        mkr_resid_adjusted = np.where(mkr_null_masks, np.float32(-1.0), np.float32(0.0) if mkr_resid is None else np.asarray(mkr_resid, dtype=np.float32))
         mkr_masks = ['0000000']*n_frs
-        mkr_scale = get_marker_scale(itf, log=log)
-        if mkr_scale is None:
-            err_msg = f'Unable to get the marker scale factor'
-            raise RuntimeError(err_msg)        
-        is_c3d_float = mkr_scale < 0
-        is_c3d_float2 = [False, True][itf.GetDataType()-1]
-        if is_c3d_float != is_c3d_float2:
-            if log: logger.debug('C3D data type is determined by POINT:SCALE')
-        mkr_dtype = [np.int16, np.float32][is_c3d_float]    
-        scale_size = [np.fabs(mkr_scale), np.float32(1.0)][is_c3d_float]
-        if is_c3d_float:
-            mkr_coords_unscaled = np.asarray(np.nan_to_num(mkr_coords), dtype=mkr_dtype)
-        else:
-            mkr_coords_unscaled = np.asarray(np.round(np.nan_to_num(mkr_coords)/scale_size), dtype=mkr_dtype)
-        dtype = [pythoncom.VT_I2, pythoncom.VT_R4][is_c3d_float]
-        dtype_arr = pythoncom.VT_ARRAY|dtype
+        mkr_coords_unscaled, dtype, dtype_arr = _encode_marker_coords(itf, mkr_coords, has_nan=mkr_null_masks.any(), log=log)
         for i in range(3):
             # var_pos = win32.VARIANT(dtype_arr, mkr_coords_unscaled[:,i])
             var_pos = win32.VARIANT(dtype_arr, mkr_coords_unscaled[:,i].tolist())
@@ -3012,24 +3564,24 @@ def add_marker(itf, mkr_name, mkr_coords, mkr_resid=None, mkr_desc=None, adjust_
         if ret == 0:
             err_msg = f'Failed to set the data for a new marker'
             raise RuntimeError(err_msg)        
-        var_const = win32.VARIANT(dtype, 1)
-        for i in range(3):
-            for idx, val in enumerate(mkr_coords_unscaled[:,i]):
-                if val == 1:
-                    ret = itf.SetPointData(n_mkrs-1, i, start_fr+idx, var_const)
-                    if ret == 0:
-                        err_msg = f'Failed to set the data for a new marker'
-                        raise RuntimeError(err_msg)
+        rows, cols = np.where(mkr_coords_unscaled == 1)
+        if rows.size > 0:
+            var_const = win32.VARIANT(dtype, 1)
+            for idx, i in zip(rows.tolist(), cols.tolist()):
+                ret = itf.SetPointData(n_mkrs-1, i, start_fr+idx, var_const)
+                if ret == 0:
+                    err_msg = f'Failed to set the data for a new marker'
+                    raise RuntimeError(err_msg)
         # Increase 'POINT:USED' by 1
-        idx_pt_used = itf.GetParameterIndex('POINT', 'USED')
+        idx_pt_used = _get_param_index(itf, 'POINT', 'USED')
         n_pt_used_after = itf.GetParameterValue(idx_pt_used, 0)
         if n_pt_used_after != (n_pt_used_before+1):
-            if log: log.debug('POINT:USED was not properly updated so that manual update will be executed')
+            if log: logger.debug('POINT:USED was not properly updated so that manual update will be executed')
             ret = itf.SetParameterValue(idx_pt_used, 0, (n_pt_used_before+1))
             if ret == 0:
                 err_msg = f'Failed to set the value of POINT:USED'
                 raise RuntimeError(err_msg)            
-        return [False, True][ret]
+        return bool(ret)
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise
@@ -3038,7 +3590,9 @@ def add_marker(itf, mkr_name, mkr_coords, mkr_resid=None, mkr_desc=None, adjust_
         raise
     except RuntimeError as err:
         if log: logger.error(err)
-        raise        
+        raise
+    finally:
+        _clear_itf_cache(itf)
 
 def add_analog(itf, sig_name, sig_value, sig_unit, sig_scale=1.0, sig_offset=0, sig_gain=0, sig_desc=None, adjust_params=False, log=False):
     """
@@ -3076,7 +3630,7 @@ def add_analog(itf, sig_name, sig_value, sig_unit, sig_scale=1.0, sig_offset=0,
 
     """
     try:
-        if log: logger.debug(f'Start adding a new "{sig_name}" analog channel ...')
+        if log: logger.debug('Start adding a new "%s" analog channel ...', sig_name)
         start_fr = get_first_frame(itf, log=log)
         n_frs = get_num_frames(itf, log=log)
         av_ratio = get_analog_video_ratio(itf, log=log)
@@ -3091,10 +3645,10 @@ def add_analog(itf, sig_name, sig_value, sig_unit, sig_scale=1.0, sig_offset=0,
             adjust_param_items(itf, 'ANALOG', 'LABELS', recreate_param=False, keep_str_len=True, log=log)
             adjust_param_items(itf, 'ANALOG', 'DESCRIPTIONS', recreate_param=False, keep_str_len=True, log=log)      
         # Check 'ANALOG:USED'
-        idx_an_used = itf.GetParameterIndex('ANALOG', 'USED')
+        idx_an_used = _get_param_index(itf, 'ANALOG', 'USED')
         n_an_used_before = itf.GetParameterValue(idx_an_used, 0) 
         # Check 'ANALOG:LABELS'
-        idx_an_labels = itf.GetParameterIndex('ANALOG', 'LABELS')
+        idx_an_labels = _get_param_index(itf, 'ANALOG', 'LABELS')
         n_an_labels_before = itf.GetParameterLength(idx_an_labels)
         # Skip if 'ANALOG:USED' and 'ANALOG:LABELS' have different numbers
         if n_an_used_before != n_an_labels_before:
@@ -3103,37 +3657,37 @@ def add_analog(itf, sig_name, sig_value, sig_unit, sig_scale=1.0, sig_offset=0,
             err_msg = err_msg0+err_msg1
             raise RuntimeError(err_msg)
         # Add an parameter to the 'ANALOG:LABELS' section
-        idx_an_labels = itf.GetParameterIndex('ANALOG', 'LABELS')
+        idx_an_labels = _get_param_index(itf, 'ANALOG', 'LABELS')
         ret = itf.AddParameterData(idx_an_labels, 1)
         n_an_labels = itf.GetParameterLength(idx_an_labels)
         ret = itf.SetParameterValue(idx_an_labels, n_an_labels-1, win32.VARIANT(pythoncom.VT_BSTR, sig_name))
         # Add an parameter to the 'ANALOG:UNITS' section
-        idx_an_units = itf.GetParameterIndex('ANALOG', 'UNITS')
+        idx_an_units = _get_param_index(itf, 'ANALOG', 'UNITS')
         ret = itf.AddParameterData(idx_an_units, 1)
         n_an_units = itf.GetParameterLength(idx_an_units)
         ret = itf.SetParameterValue(idx_an_units, n_an_units-1, win32.VARIANT(pythoncom.VT_BSTR, sig_unit))      
         # Add an parameter to the 'ANALOG:SCALE' section
-        idx_an_scale = itf.GetParameterIndex('ANALOG', 'SCALE')
+        idx_an_scale = _get_param_index(itf, 'ANALOG', 'SCALE')
         ret = itf.AddParameterData(idx_an_scale, 1)
         n_an_scale = itf.GetParameterLength(idx_an_scale)
         ret = itf.SetParameterValue(idx_an_scale, n_an_scale-1, win32.VARIANT(pythoncom.VT_R4, sig_scale))
         # Add an parameter to the 'ANALOG:OFFSET' section
-        idx_an_offset = itf.GetParameterIndex('ANALOG', 'OFFSET')
+        idx_an_offset = _get_param_index(itf, 'ANALOG', 'OFFSET')
         ret = itf.AddParameterData(idx_an_offset, 1)
         n_an_offset = itf.GetParameterLength(idx_an_offset)
         sig_format = get_analog_format(itf, log=log)
         is_sig_unsigned = (sig_format is not None) and (sig_format.upper()=='UNSIGNED')
-        sig_offset_comtype = [pythoncom.VT_I2, pythoncom.VT_R4][is_sig_unsigned]
-        sig_offset_dtype = [np.int16, np.uint16][is_sig_unsigned]
+        sig_offset_comtype = pythoncom.VT_R4 if is_sig_unsigned else pythoncom.VT_I2
+        sig_offset_dtype = np.uint16 if is_sig_unsigned else np.int16
         ret = itf.SetParameterValue(idx_an_offset, n_an_offset-1, win32.VARIANT(sig_offset_comtype, sig_offset))
         # Check for 'ANALOG:GAIN' section and add 0 if it exists
-        idx_an_gain = itf.GetParameterIndex('ANALOG', 'GAIN')
+        idx_an_gain = _get_param_index(itf, 'ANALOG', 'GAIN')
         if idx_an_gain != -1:
             ret = itf.AddParameterData(idx_an_gain, 1)
             n_an_gain = itf.GetParameterLength(idx_an_gain)
             ret = itf.SetParameterValue(idx_an_gain, n_an_gain-1, win32.VARIANT(pythoncom.VT_I2, sig_gain))    
         # Add an parameter to the 'ANALOG:DESCRIPTIONS' section
-        idx_an_desc = itf.GetParameterIndex('ANALOG', 'DESCRIPTIONS')
+        idx_an_desc = _get_param_index(itf, 'ANALOG', 'DESCRIPTIONS')
         ret = itf.AddParameterData(idx_an_desc, 1)
         n_an_desc = itf.GetParameterLength(idx_an_desc)
         sig_desc_in = sig_name if sig_desc is None else sig_desc
@@ -3142,17 +3696,21 @@ def add_analog(itf, sig_name, sig_value, sig_unit, sig_scale=1.0, sig_offset=0,
         idx_new_an_ch = itf.AddAnalogChannel()
         # n_an_chs = itf.GetAnalogChannels()
         gen_scale = get_analog_gen_scale(itf, log=log)
-        sig_value_unscaled = np.asarray(sig_value, dtype=np.float32)/(np.float32(sig_scale)*gen_scale)+np.float32(sig_offset_dtype(sig_offset))
+        sig_inv_scale = 1.0/(float(sig_scale)*float(gen_scale))
+        sig_offset_val = float(sig_offset_dtype(sig_offset))
+        sig_value_unscaled = np.array(sig_value, dtype=np.float32)
+        np.multiply(sig_value_unscaled, sig_inv_scale, out=sig_value_unscaled)
+        np.add(sig_value_unscaled, sig_offset_val, out=sig_value_unscaled)
         # variant = win32.VARIANT(pythoncom.VT_ARRAY|pythoncom.VT_R4, sig_value_unscaled)
         variant = win32.VARIANT(pythoncom.VT_ARRAY|pythoncom.VT_R4, sig_value_unscaled.tolist())
         ret = itf.SetAnalogDataEx(idx_new_an_ch, start_fr, variant)
         # Increase the value 'ANALOG:USED' by 1
-        idx_an_used = itf.GetParameterIndex('ANALOG', 'USED')
+        idx_an_used = _get_param_index(itf, 'ANALOG', 'USED')
         n_an_used_after = itf.GetParameterValue(idx_an_used, 0)
         if n_an_used_after != (n_an_used_before+1):
-            if log: log.debug('ANALOG:USED was not properly updated so that manual update will be executed')
+            if log: logger.debug('ANALOG:USED was not properly updated so that manual update will be executed')
             ret = itf.SetParameterValue(idx_an_used, 0, (n_an_used_before+1))
-        return [False, True][ret]
+        return bool(ret)
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise
@@ -3162,6 +3720,8 @@ def add_analog(itf, sig_name, sig_value, sig_unit, sig_scale=1.0, sig_offset=0,
     except RuntimeError as err:
         if log: logger.error(err)
         raise
+    finally:
+        _clear_itf_cache(itf)
 
 def delete_frames(itf, start_frame, num_frames, log=False):
     """
@@ -3192,6 +3752,7 @@ def delete_frames(itf, start_frame, num_frames, log=False):
             err_msg = f'"start_frame" number should be less than {get_last_frame(itf)}'
             raise ValueError(err_msg)
         n_frs_updated = itf.DeleteFrames(start_frame, num_frames)
+        _clear_itf_cache(itf)
         return n_frs_updated
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
@@ -3238,32 +3799,17 @@ def set_marker_pos(itf, mkr_name, mkr_coords, start_frame=None, end_frame=None,
         if mkr_idx == -1 or mkr_idx is None:
             err_msg = f'Unable to get the index of "{mkr_name}"'
             raise ValueError(err_msg)
-        mkr_scale = get_marker_scale(itf, log=log)
-        if mkr_scale is None:
-            err_msg = f'Unable to get the marker scale factor'
-            raise RuntimeError(err_msg)
-        is_c3d_float = mkr_scale < 0
-        is_c3d_float2 = [False, True][itf.GetDataType()-1]
-        if is_c3d_float != is_c3d_float2:
-            if log: logger.debug('C3D data type is determined by POINT:SCALE')
-        mkr_dtype = [np.int16, np.float32][is_c3d_float]
-        scale_size = [np.fabs(mkr_scale), np.float32(1.0)][is_c3d_float]
-        if is_c3d_float:
-            mkr_coords_unscaled = np.asarray(np.nan_to_num(mkr_coords), dtype=mkr_dtype)
-        else:
-            mkr_coords_unscaled = np.asarray(np.round(np.nan_to_num(mkr_coords)/scale_size), dtype=mkr_dtype)
-        dtype = [pythoncom.VT_I2, pythoncom.VT_R4][is_c3d_float]
-        dtype_arr = pythoncom.VT_ARRAY|dtype
+        mkr_coords_unscaled, dtype, dtype_arr = _encode_marker_coords(itf, mkr_coords, log=log)
         for i in range(3):
             # variant = win32.VARIANT(dtype_arr, mkr_coords_unscaled[:,i])
             variant = win32.VARIANT(dtype_arr, mkr_coords_unscaled[:,i].tolist())
             ret = itf.SetPointDataEx(mkr_idx, i, start_fr, variant)
-        var_const = win32.VARIANT(dtype, 1)
-        for i in range(3):
-            for idx, val in enumerate(mkr_coords_unscaled[:,i]):
-                if val == 1:
-                    ret = itf.SetPointData(mkr_idx, i, start_fr+idx, var_const)
-        return [False, True][ret]
+        rows, cols = np.where(mkr_coords_unscaled == 1)
+        if rows.size > 0:
+            var_const = win32.VARIANT(dtype, 1)
+            for idx, i in zip(rows.tolist(), cols.tolist()):
+                ret = itf.SetPointData(mkr_idx, i, start_fr+idx, var_const)
+        return bool(ret)
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise
@@ -3272,7 +3818,9 @@ def set_marker_pos(itf, mkr_name, mkr_coords, start_frame=None, end_frame=None,
         raise
     except RuntimeError as err:
         if log: logger.error(err)
-        raise        
+        raise
+    finally:
+        _drop_cached(itf, ('mkr_data', mkr_name))
     
 def set_marker_resid(itf, mkr_name, mkr_resid, start_frame=None, end_frame=None, log=False):
     """
@@ -3317,17 +3865,20 @@ def set_marker_resid(itf, mkr_name, mkr_resid, start_frame=None, end_frame=None,
         # variant = win32.VARIANT(dtype_arr, mkr_resid)
         variant = win32.VARIANT(dtype_arr, mkr_resid.tolist())
         ret = itf.SetPointDataEx(mkr_idx, 3, start_fr, variant)
-        var_const = win32.VARIANT(dtype, 1)
-        for idx, val in enumerate(mkr_resid):
-            if val == 1:
-                ret = itf.SetPointData(mkr_idx, 3, start_fr+idx, var_const) 
-        return [False, True][ret]
+        idxs = np.flatnonzero(mkr_resid == 1)
+        if idxs.size > 0:
+            var_const = win32.VARIANT(dtype, 1)
+            for idx in idxs.tolist():
+                ret = itf.SetPointData(mkr_idx, 3, start_fr+idx, var_const)
+        return bool(ret)
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise
     except ValueError as err:
         if log: logger.error(err)
         raise
+    finally:
+        _drop_cached(itf, ('mkr_data', mkr_name))
         
 def set_analog_data(itf, sig_name, sig_value, start_frame=None, end_frame=None, log=False):
     """
@@ -3374,7 +3925,7 @@ def set_analog_data(itf, sig_name, sig_value, start_frame=None, end_frame=None,
         sig_value_unscaled = np.asarray(sig_value, dtype=np.float32)/(sig_scale*gen_scale)+sig_offset
         variant = win32.VARIANT(pythoncom.VT_ARRAY|pythoncom.VT_R4, sig_value_unscaled.tolist())
         ret = itf.SetAnalogDataEx(sig_idx, start_fr, variant)
-        return [False, True][ret]
+        return bool(ret)
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise
@@ -3426,7 +3977,7 @@ def set_analog_subframe_data(itf, sig_name, sig_value, start_frame, sub_frame, l
         sig_value_unscaled = np.float32(sig_value)/(sig_scale*gen_scale)+sig_offset
         variant = win32.VARIANT(pythoncom.VT_R4, sig_value_unscaled)
         ret = itf.SetAnalogData(sig_idx, start_fr, sub_frame, variant)
-        return [False, True][ret]
+        return bool(ret)
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
         raise
@@ -3434,6 +3985,93 @@ def set_analog_subframe_data(itf, sig_name, sig_value, start_frame, sub_frame, l
         if log: logger.error(err)
         raise        
 
+@contextmanager
+def batched_marker_updates(itf, log=False):
+    """
+    Defer the marker writes of the gap filling and recovery functions until the end of a 'with' block.
+
+    Inside the block, the results of recover_marker_rel(), recover_marker_rbt(), fill_marker_gap_rbt(), fill_marker_gap_pattern()
+    and fill_marker_gap_interp() are queued instead of being written, and these functions read the queued data back,
+    so that each marker is written to the C3Dserver only once when the block exits normally.
+    If an exception is raised inside the block, the queued data is discarded and nothing is written.
+    For integer-format files, the queued coordinates are rounded to POINT:SCALE as writing and reading them back would do.
+    The cluster and donor markers read by these functions are cached for the duration of the block only.
+    Writes through the functions of this module invalidate the cached marker, but direct writes through the COM object inside the block do not.
+    Other functions (e.g. get_marker_pos()) read what is in the C3Dserver, so they do not see the queued data until then.
+    Nested blocks on the same COM object join the outermost one.
+
+    Parameters
+    ----------
+    itf : win32com.client.CDispatch
+        COM object of the C3Dserver.
+    log : bool, optional
+        Whether to write logs or not. The default is False.
+
+    Yields
+    ------
+    None
+
+    """
+    key = id(itf)
+    if key in _itf_marker_batches:
+        yield
+        return
+    pending = _itf_marker_batches[key] = {}
+    try:
+        yield
+    except BaseException:
+        del _itf_marker_batches[key]
+        _drop_cached_marker_data(itf)
+        if log: logger.warning('Discarding %d queued marker(s)', len(pending))
+        raise
+    del _itf_marker_batches[key]
+    _drop_cached_marker_data(itf)
+    if log: logger.debug('Writing %d queued marker(s)', len(pending))
+    for mkr_name, mkr_data in pending.items():
+        set_marker_pos(itf, mkr_name, mkr_data[:,0:3], None, None, log=log)
+        set_marker_resid(itf, mkr_name, mkr_data[:,3], None, None, log=log)
+
+def _read_marker_data(itf, mkr_name, log=False):
+    # full-range marker data, queued data first if a batch is active
+    pending = _itf_marker_batches.get(id(itf), {})
+    if mkr_name in pending:
+        return pending[mkr_name].copy()
+    return get_marker_data(itf, mkr_name, blocked_nan=False, log=log)
+
+def _write_marker_data(itf, mkr_name, mkr_data, log=False):
+    # queue the full-range marker data if a batch is active, otherwise write it now
+    pending = _itf_marker_batches.get(id(itf), None)
+    if pending is not None:
+        if not _get_c3d_float_flag(itf, log=log):
+            # keep the queued coordinates identical to what a write and a read-back would give
+            mkr_coords_unscaled, _, _ = _encode_marker_coords(itf, mkr_data[:,0:3], log=log)
+            mkr_data[:,0:3] = mkr_coords_unscaled*np.fabs(get_marker_scale(itf, log=log))
+        pending[mkr_name] = mkr_data
+        _drop_cached(itf, ('mkr_data', mkr_name))
+    else:
+        set_marker_pos(itf, mkr_name, mkr_data[:,0:3], None, None, log=log)
+        set_marker_resid(itf, mkr_name, mkr_data[:,3], None, None, log=log)
+
+def _drop_cached_marker_data(itf):
+    # release all the marker data cached by _get_marker_data_cached()
+    cache = _itf_cache.get(id(itf), None)
+    if cache is not None:
+        for key in [k for k in cache if isinstance(k, tuple) and k[0] == 'mkr_data']:
+            del cache[key]
+
+def _get_marker_data_cached(itf, mkr_name, log=False):
+    # full-range data of a cluster or donor marker; only inside batched_marker_updates() is it cached (read-only),
+    # until the marker is written, the file changes or the block exits
+    pending = _itf_marker_batches.get(id(itf), None)
+    if pending is None:
+        return get_marker_data(itf, mkr_name, blocked_nan=False, log=log)
+    if mkr_name in pending:
+        return pending[mkr_name].copy()
+    mkr_data = _get_cached(itf, ('mkr_data', mkr_name), lambda: get_marker_data(itf, mkr_name, blocked_nan=False, log=log))
+    if mkr_data is not None:
+        mkr_data.flags.writeable = False
+    return mkr_data
+
 def recover_marker_rel(itf, tgt_mkr_name, cl_mkr_names, log=False):
     """
     Recover the trajectory of a marker using the relation between a group (cluster) of markers.
@@ -3473,40 +4111,40 @@ def recover_marker_rel(itf, tgt_mkr_name, cl_mkr_names, log=False):
     
     """
     try:
-        if log: logger.debug(f'Start recovery of "{tgt_mkr_name}" ...')
+        if log: logger.debug('Start recovery of "%s" ...', tgt_mkr_name)
         n_total_frs = get_num_frames(itf, log=log)
-        tgt_mkr_data = get_marker_data(itf, tgt_mkr_name, blocked_nan=False, log=log)
+        tgt_mkr_data = _read_marker_data(itf, tgt_mkr_name, log=log)
         if tgt_mkr_data is None:
             err_msg = f'Unable to get the information of "{tgt_mkr_name}"'
             raise ValueError(err_msg)            
         tgt_mkr_coords = tgt_mkr_data[:,0:3]
         tgt_mkr_resid = tgt_mkr_data[:,3]
-        tgt_mkr_valid_mask = np.where(np.isclose(tgt_mkr_resid, -1), False, True)
+        tgt_mkr_valid_mask = np.not_equal(tgt_mkr_resid, -1)
         n_tgt_mkr_valid_frs = np.count_nonzero(tgt_mkr_valid_mask)
         if n_tgt_mkr_valid_frs == 0:
-            if log: logger.info(f'Recovery of "{tgt_mkr_name}" skipped: no valid target marker frame')
+            if log: logger.info('Recovery of "%s" skipped: no valid target marker frame', tgt_mkr_name)
             return False, n_tgt_mkr_valid_frs
         if n_tgt_mkr_valid_frs == n_total_frs:
-            if log: logger.info(f'Recovery of "{tgt_mkr_name}" skipped: all target marker frames valid')
+            if log: logger.info('Recovery of "%s" skipped: all target marker frames valid', tgt_mkr_name)
             return False, n_tgt_mkr_valid_frs
         dict_cl_mkr_coords = {}
         dict_cl_mkr_valid = {}
         cl_mkr_valid_mask = np.ones((n_total_frs), dtype=bool)
         for mkr in cl_mkr_names:
-            mkr_data = get_marker_data(itf, mkr, blocked_nan=False, log=log)
+            mkr_data = _get_marker_data_cached(itf, mkr, log=log)
             if mkr_data is None:
                 err_msg = f'Unable to get the information of "{mkr}"'
                 raise ValueError(err_msg)
             dict_cl_mkr_coords[mkr] = mkr_data[:, 0:3]
-            dict_cl_mkr_valid[mkr] = np.where(np.isclose(mkr_data[:,3], -1), False, True)
-            cl_mkr_valid_mask = np.logical_and(cl_mkr_valid_mask, dict_cl_mkr_valid[mkr])
-        all_mkr_valid_mask = np.logical_and(cl_mkr_valid_mask, tgt_mkr_valid_mask)
+            dict_cl_mkr_valid[mkr] = np.not_equal(mkr_data[:,3], -1)
+            cl_mkr_valid_mask &= dict_cl_mkr_valid[mkr]
+        all_mkr_valid_mask = cl_mkr_valid_mask & tgt_mkr_valid_mask
         if not np.any(all_mkr_valid_mask):
-            if log: logger.info(f'Recovery of "{tgt_mkr_name}" skipped: no common valid frame among markers')
+            if log: logger.info('Recovery of "%s" skipped: no common valid frame among markers', tgt_mkr_name)
             return False, n_tgt_mkr_valid_frs
-        cl_mkr_only_valid_mask = np.logical_and(cl_mkr_valid_mask, np.logical_not(tgt_mkr_valid_mask))
+        cl_mkr_only_valid_mask = cl_mkr_valid_mask & ~tgt_mkr_valid_mask
         if not np.any(cl_mkr_only_valid_mask):
-            if log: logger.info(f'Recovery of "{tgt_mkr_name}" skipped: cluster markers not helpful')
+            if log: logger.info('Recovery of "%s" skipped: cluster markers not helpful', tgt_mkr_name)
             return False, n_tgt_mkr_valid_frs
         all_mkr_valid_frs = np.where(all_mkr_valid_mask)[0]
         cl_mkr_only_valid_frs = np.where(cl_mkr_only_valid_mask)[0]
@@ -3517,37 +4155,34 @@ def recover_marker_rel(itf, tgt_mkr_name, cl_mkr_names, log=False):
         vec1 = p2-p0
         vec0_norm = np.linalg.norm(vec0, axis=1, keepdims=True)
         vec1_norm = np.linalg.norm(vec1, axis=1, keepdims=True)
-        vec0_unit = np.divide(vec0, vec0_norm, where=(vec0_norm!=0))
-        vec1_unit = np.divide(vec1, vec1_norm, where=(vec1_norm!=0))
+        vec0_unit = np.divide(vec0, vec0_norm, out=np.zeros_like(vec0), where=(vec0_norm!=0))
+        vec1_unit = np.divide(vec1, vec1_norm, out=np.zeros_like(vec1), where=(vec1_norm!=0))
         vec2 = np.cross(vec0_unit, vec1_unit)
         vec2_norm = np.linalg.norm(vec2, axis=1, keepdims=True)
-        vec2_unit = np.divide(vec2, vec2_norm, where=(vec2_norm!=0))
+        vec2_unit = np.divide(vec2, vec2_norm, out=np.zeros_like(vec2), where=(vec2_norm!=0))
         vec_z = vec2_unit
         vec_x = vec0_unit
         vec_y = np.cross(vec_z, vec_x)
-        mat_rot = np.asarray([vec_x.T, vec_y.T, vec_z.T]).T
-        tgt_mkr_coords_rel = np.einsum('ij,ijk->ik', (tgt_mkr_coords-p0)[all_mkr_valid_mask], mat_rot[all_mkr_valid_mask])
-        tgt_mkr_coords_recovered = np.zeros((cl_mkr_only_valid_frs.size, 3), dtype=np.float32)
-        for idx, fr in np.ndenumerate(cl_mkr_only_valid_frs):
-            search_idx = np.searchsorted(all_mkr_valid_frs, fr)
-            if search_idx>=all_mkr_valid_frs.shape[0] or search_idx==0:
-                tgt_coords_rel_idx = (np.abs(all_mkr_valid_frs-fr)).argmin()
-                tgt_coords_rel = tgt_mkr_coords_rel[tgt_coords_rel_idx]
-            else:
-                idx1 = search_idx
-                idx0 = search_idx-1
-                fr1 = all_mkr_valid_frs[idx1]
-                fr0 = all_mkr_valid_frs[idx0]
-                a = np.float32(fr-fr0)
-                b = np.float32(fr1-fr)
-                tgt_coords_rel = (b*tgt_mkr_coords_rel[idx0]+a*tgt_mkr_coords_rel[idx1])/(a+b)
-            tgt_mkr_coords_recovered[idx] = p0[fr]+np.dot(mat_rot[fr], tgt_coords_rel)
+        mat_rot = np.stack((vec_x, vec_y, vec_z), axis=-1)
+        tgt_mkr_coords_rel = np.matmul((tgt_mkr_coords-p0)[all_mkr_valid_mask][:,None,:], mat_rot[all_mkr_valid_mask])[:,0,:]
+        # interpolate the relative coordinates between the neighboring common valid frames,
+        # holding the nearest one for the frames before the first or after the last of them
+        n_all_mkr_valid_frs = all_mkr_valid_frs.shape[0]
+        search_idxs = np.searchsorted(all_mkr_valid_frs, cl_mkr_only_valid_frs)
+        idx0 = np.clip(search_idxs-1, 0, n_all_mkr_valid_frs-1)
+        idx1 = np.clip(search_idxs, 0, n_all_mkr_valid_frs-1)
+        a = (cl_mkr_only_valid_frs-all_mkr_valid_frs[idx0]).astype(np.float32)
+        b = (all_mkr_valid_frs[idx1]-cl_mkr_only_valid_frs).astype(np.float32)
+        outside_mask = (idx0 == idx1)
+        a[outside_mask] = 0.0
+        b[outside_mask] = 1.0
+        tgt_coords_rel = (b[:,None]*tgt_mkr_coords_rel[idx0]+a[:,None]*tgt_mkr_coords_rel[idx1])/(a+b)[:,None]
+        tgt_mkr_coords_recovered = p0[cl_mkr_only_valid_frs]+np.matmul(mat_rot[cl_mkr_only_valid_frs], tgt_coords_rel[:,:,None])[:,:,0]
         tgt_mkr_coords[cl_mkr_only_valid_mask] = tgt_mkr_coords_recovered
         tgt_mkr_resid[cl_mkr_only_valid_mask] = 0.0
-        set_marker_pos(itf, tgt_mkr_name, tgt_mkr_coords, None, None, log=log)
-        set_marker_resid(itf, tgt_mkr_name, tgt_mkr_resid, None, None, log=log)
-        n_tgt_mkr_valid_frs_updated = np.count_nonzero(np.where(np.isclose(tgt_mkr_resid, -1), False, True))
-        if log: logger.info(f'Recovery of "{tgt_mkr_name}" finished')
+        _write_marker_data(itf, tgt_mkr_name, tgt_mkr_data, log=log)
+        n_tgt_mkr_valid_frs_updated = np.count_nonzero(np.not_equal(tgt_mkr_resid, -1))
+        if log: logger.info('Recovery of "%s" finished', tgt_mkr_name)
         return True, n_tgt_mkr_valid_frs_updated
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
@@ -3592,40 +4227,40 @@ def recover_marker_rbt(itf, tgt_mkr_name, cl_mkr_names, log=False):
     
     """
     try:
-        if log: logger.debug(f'Start recovery of "{tgt_mkr_name}" ...')
+        if log: logger.debug('Start recovery of "%s" ...', tgt_mkr_name)
         n_total_frs = get_num_frames(itf, log=log)
-        tgt_mkr_data = get_marker_data(itf, tgt_mkr_name, blocked_nan=False, log=log)
+        tgt_mkr_data = _read_marker_data(itf, tgt_mkr_name, log=log)
         if tgt_mkr_data is None:
             err_msg = f'Unable to get the information of "{tgt_mkr_name}"'
             raise ValueError(err_msg)        
         tgt_mkr_coords = tgt_mkr_data[:,0:3]
         tgt_mkr_resid = tgt_mkr_data[:,3]
-        tgt_mkr_valid_mask = np.where(np.isclose(tgt_mkr_resid, -1), False, True)
+        tgt_mkr_valid_mask = np.not_equal(tgt_mkr_resid, -1)
         n_tgt_mkr_valid_frs = np.count_nonzero(tgt_mkr_valid_mask)
         if n_tgt_mkr_valid_frs == 0:
-            if log: logger.info(f'Recovery of "{tgt_mkr_name}" skipped: no valid target marker frame')
+            if log: logger.info('Recovery of "%s" skipped: no valid target marker frame', tgt_mkr_name)
             return False, n_tgt_mkr_valid_frs
         if n_tgt_mkr_valid_frs == n_total_frs:
-            if log: logger.info('Recovery of "{tgt_mkr_name}" skipped: all target marker frames valid')
+            if log: logger.info('Recovery of "%s" skipped: all target marker frames valid', tgt_mkr_name)
             return False, n_tgt_mkr_valid_frs    
         dict_cl_mkr_coords = {}
         dict_cl_mkr_valid = {}
         cl_mkr_valid_mask = np.ones((n_total_frs), dtype=bool)
         for mkr in cl_mkr_names:
-            mkr_data = get_marker_data(itf, mkr, blocked_nan=False, log=log)
+            mkr_data = _get_marker_data_cached(itf, mkr, log=log)
             if mkr_data is None:
                 err_msg = f'Unable to get the information of "{mkr}"'
                 raise ValueError(err_msg)
             dict_cl_mkr_coords[mkr] = mkr_data[:,0:3]
-            dict_cl_mkr_valid[mkr] = np.where(np.isclose(mkr_data[:,3], -1), False, True)
-            cl_mkr_valid_mask = np.logical_and(cl_mkr_valid_mask, dict_cl_mkr_valid[mkr])
-        all_mkr_valid_mask = np.logical_and(cl_mkr_valid_mask, tgt_mkr_valid_mask)
+            dict_cl_mkr_valid[mkr] = np.not_equal(mkr_data[:,3], -1)
+            cl_mkr_valid_mask &= dict_cl_mkr_valid[mkr]
+        all_mkr_valid_mask = cl_mkr_valid_mask & tgt_mkr_valid_mask
         if not np.any(all_mkr_valid_mask):
-            if log: logger.info('Recovery of "{tgt_mkr_name}" skipped: no common valid frame among markers')
+            if log: logger.info('Recovery of "%s" skipped: no common valid frame among markers', tgt_mkr_name)
             return False, n_tgt_mkr_valid_frs
-        cl_mkr_only_valid_mask = np.logical_and(cl_mkr_valid_mask, np.logical_not(tgt_mkr_valid_mask))
+        cl_mkr_only_valid_mask = cl_mkr_valid_mask & ~tgt_mkr_valid_mask
         if not np.any(cl_mkr_only_valid_mask):
-            if log: logger.info('Recovery of "{tgt_mkr_name}" skipped: cluster markers not helpful')
+            if log: logger.info('Recovery of "%s" skipped: cluster markers not helpful', tgt_mkr_name)
             return False, n_tgt_mkr_valid_frs
         all_mkr_valid_frs = np.where(all_mkr_valid_mask)[0]
         cl_mkr_only_valid_frs = np.where(cl_mkr_only_valid_mask)[0]
@@ -3642,44 +4277,36 @@ def recover_marker_rbt(itf, tgt_mkr_name, cl_mkr_names, log=False):
         vec1 = p2-p0
         vec0_norm = np.linalg.norm(vec0, axis=1, keepdims=True)
         vec1_norm = np.linalg.norm(vec1, axis=1, keepdims=True)
-        vec0_unit = np.divide(vec0, vec0_norm, where=(vec0_norm!=0))
-        vec1_unit = np.divide(vec1, vec1_norm, where=(vec1_norm!=0))
+        vec0_unit = np.divide(vec0, vec0_norm, out=np.zeros_like(vec0), where=(vec0_norm!=0))
+        vec1_unit = np.divide(vec1, vec1_norm, out=np.zeros_like(vec1), where=(vec1_norm!=0))
         vec2 = np.cross(vec0_unit, vec1_unit)
         vec2_norm = np.linalg.norm(vec2, axis=1, keepdims=True)
-        vec2_unit = np.divide(vec2, vec2_norm, where=(vec2_norm!=0))
+        vec2_unit = np.divide(vec2, vec2_norm, out=np.zeros_like(vec2), where=(vec2_norm!=0))
         vec3 = p3-p0
         vec_z = vec2_unit
         vec_x = vec0_unit
         vec_y = np.cross(vec_z, vec_x)
-        mat_rot = np.asarray([vec_x.T, vec_y.T, vec_z.T]).T
-        for idx, fr in np.ndenumerate(cl_mkr_only_valid_frs):
-            search_idx = np.searchsorted(all_mkr_valid_frs, fr)
-            if search_idx == 0:
-                fr0 = all_mkr_valid_frs[0]
-                rot_fr0_to_fr = np.dot(mat_rot[fr], mat_rot[fr0].T)
-                vt_fr0 = np.dot(rot_fr0_to_fr, vec3[fr0])
-                vc = vt_fr0
-            elif search_idx >= all_mkr_valid_frs.shape[0]:
-                fr1 = all_mkr_valid_frs[all_mkr_valid_frs.shape[0]-1]
-                rot_fr1_to_fr = np.dot(mat_rot[fr], mat_rot[fr1].T)
-                vt_fr1 = np.dot(rot_fr1_to_fr, vec3[fr1])
-                vc = vt_fr1
-            else:
-                fr0 = all_mkr_valid_frs[search_idx-1]
-                fr1 = all_mkr_valid_frs[search_idx]
-                rot_fr0_to_fr = np.dot(mat_rot[fr], mat_rot[fr0].T)
-                rot_fr1_to_fr = np.dot(mat_rot[fr], mat_rot[fr1].T)
-                vt_fr0 = np.dot(rot_fr0_to_fr, vec3[fr0])
-                vt_fr1 = np.dot(rot_fr1_to_fr, vec3[fr1])
-                a = np.float32(fr-fr0)
-                b = np.float32(fr1-fr)
-                vc = (b*vt_fr0+a*vt_fr1)/(a+b)
-            tgt_mkr_coords[fr] = p0[fr]+vc
-            tgt_mkr_resid[fr] = 0.0
-        set_marker_pos(itf, tgt_mkr_name, tgt_mkr_coords, None, None, log=log)
-        set_marker_resid(itf, tgt_mkr_name, tgt_mkr_resid, None, None, log=log)
-        n_tgt_mkr_valid_frs_updated = np.count_nonzero(np.where(np.isclose(tgt_mkr_resid, -1), False, True))
-        if log: logger.info(f'Recovery of "{tgt_mkr_name}" finished')
+        mat_rot = np.stack((vec_x, vec_y, vec_z), axis=-1)
+        # transform the target vector of the neighboring common valid frames into each frame to recover,
+        # using only the nearest one for the frames before the first or after the last of them
+        n_all_mkr_valid_frs = all_mkr_valid_frs.shape[0]
+        search_idxs = np.searchsorted(all_mkr_valid_frs, cl_mkr_only_valid_frs)
+        frs0 = all_mkr_valid_frs[np.clip(search_idxs-1, 0, n_all_mkr_valid_frs-1)]
+        frs1 = all_mkr_valid_frs[np.clip(search_idxs, 0, n_all_mkr_valid_frs-1)]
+        mat_rot_fr = mat_rot[cl_mkr_only_valid_frs]
+        vt_fr0 = np.einsum('ijk,ik->ij', mat_rot_fr, np.einsum('ikj,ik->ij', mat_rot[frs0], vec3[frs0]))
+        vt_fr1 = np.einsum('ijk,ik->ij', mat_rot_fr, np.einsum('ikj,ik->ij', mat_rot[frs1], vec3[frs1]))
+        a = (cl_mkr_only_valid_frs-frs0).astype(np.float32)
+        b = (frs1-cl_mkr_only_valid_frs).astype(np.float32)
+        outside_mask = (frs0 == frs1)
+        a[outside_mask] = 0.0
+        b[outside_mask] = 1.0
+        vc = (b[:,None]*vt_fr0+a[:,None]*vt_fr1)/(a+b)[:,None]
+        tgt_mkr_coords[cl_mkr_only_valid_frs] = p0[cl_mkr_only_valid_frs]+vc
+        tgt_mkr_resid[cl_mkr_only_valid_frs] = 0.0
+        _write_marker_data(itf, tgt_mkr_name, tgt_mkr_data, log=log)
+        n_tgt_mkr_valid_frs_updated = np.count_nonzero(np.not_equal(tgt_mkr_resid, -1))
+        if log: logger.info('Recovery of "%s" finished', tgt_mkr_name)
         return True, n_tgt_mkr_valid_frs_updated
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
@@ -3688,6 +4315,45 @@ def recover_marker_rbt(itf, tgt_mkr_name, cl_mkr_names, log=False):
         if log: logger.error(err)
         raise        
 
+def _det3(M):
+    # determinants of (..., 3, 3) matrices by cofactor expansion, without a LAPACK call
+    return (M[...,0,0]*(M[...,1,1]*M[...,2,2]-M[...,1,2]*M[...,2,1])
+            -M[...,0,1]*(M[...,1,0]*M[...,2,2]-M[...,1,2]*M[...,2,0])
+            +M[...,0,2]*(M[...,1,0]*M[...,2,1]-M[...,1,1]*M[...,2,0]))
+
+def _rbt(A, B, use_svd=False, return_err=False):
+    # least-squares rigid body transformations (R, t) that map the points A onto B, batched over the leading axes of (..., n_points, 3)
+    # rotation from Horn's unit quaternion (largest eigenvector of a symmetric 4x4 matrix), or from the SVD of C if 'use_svd'
+    # fitting errors are only evaluated if 'return_err'
+    Ac = A.mean(axis=-2)
+    Bc = B.mean(axis=-2)
+    C = np.einsum('...ki,...kj->...ij', B-Bc[...,None,:], A-Ac[...,None,:], dtype=np.float64)
+    if use_svd:
+        U, S, Vt = np.linalg.svd(C)
+        D = np.ones(U.shape[:-1], dtype=U.dtype)
+        D[...,2] = np.sign(_det3(U)*_det3(Vt))
+        R = np.matmul(U, D[...,:,None]*Vt)
+    else:
+        Sxx, Syx, Szx = C[...,0,0], C[...,0,1], C[...,0,2]
+        Sxy, Syy, Szy = C[...,1,0], C[...,1,1], C[...,1,2]
+        Sxz, Syz, Szz = C[...,2,0], C[...,2,1], C[...,2,2]
+        N = np.stack([np.stack([Sxx+Syy+Szz, Syz-Szy, Szx-Sxz, Sxy-Syx], axis=-1),
+                      np.stack([Syz-Szy, Sxx-Syy-Szz, Sxy+Syx, Szx+Sxz], axis=-1),
+                      np.stack([Szx-Sxz, Sxy+Syx, -Sxx+Syy-Szz, Syz+Szy], axis=-1),
+                      np.stack([Sxy-Syx, Szx+Sxz, Syz+Szy, -Sxx-Syy+Szz], axis=-1)], axis=-2)
+        q = np.linalg.eigh(N)[1][...,:,-1]
+        w, x, y, z = q[...,0], q[...,1], q[...,2], q[...,3]
+        R = np.stack([np.stack([w*w+x*x-y*y-z*z, 2*(x*y-w*z), 2*(x*z+w*y)], axis=-1),
+                      np.stack([2*(x*y+w*z), w*w-x*x+y*y-z*z, 2*(y*z-w*x)], axis=-1),
+                      np.stack([2*(x*z-w*y), 2*(y*z+w*x), w*w-x*x-y*y+z*z], axis=-1)], axis=-2)
+    t = Bc-np.einsum('...ij,...j->...i', R, Ac)
+    if not return_err:
+        return R, t
+    err_vec = np.einsum('...ij,...kj->...ki', R, A)+t[...,None,:]-B
+    err_norm = np.linalg.norm(err_vec, axis=-1)
+    mean_err_norm = np.mean(err_norm, axis=-1)
+    return R, t, err_vec, err_norm, mean_err_norm
+
 def fill_marker_gap_rbt(itf, tgt_mkr_name, cl_mkr_names, log=False):
     """
     Fill the gaps in the trajectory of a marker by rbt(rigid body transformation) using a group (cluster) markers.
@@ -3719,92 +4385,76 @@ def fill_marker_gap_rbt(itf, tgt_mkr_name, cl_mkr_names, log=False):
     .. [1] https://github.com/mkjung99/gapfill
     
     """
-    def RBT(A, B):
-        Ac = A.mean(axis=0)
-        Bc = B.mean(axis=0)
-        C = np.dot((B-Bc).T, (A-Ac))
-        U, S, Vt = np.linalg.svd(C)
-        R = np.dot(U, np.dot(np.diag([1, 1, np.linalg.det(np.dot(U, Vt))]), Vt))
-        t = Bc-np.dot(R, Ac)
-        err_vec = np.dot(R, A.T).T+t-B
-        err_norm = np.linalg.norm(err_vec, axis=1)
-        mean_err_norm = np.mean(err_norm)
-        return R, t, err_vec, err_norm, mean_err_norm
     try:
-        if log: logger.debug(f'Start gap filling of "{tgt_mkr_name}" ...')     
+        if log: logger.debug('Start gap filling of "%s" ...', tgt_mkr_name)
         n_total_frs = get_num_frames(itf, log=log)
-        tgt_mkr_data = get_marker_data(itf, tgt_mkr_name, blocked_nan=False, log=log)
+        tgt_mkr_data = _read_marker_data(itf, tgt_mkr_name, log=log)
         if tgt_mkr_data is None:
             err_msg = f'Unable to get the information of "{tgt_mkr_name}"'
             raise ValueError(err_msg)        
         tgt_mkr_coords = tgt_mkr_data[:,0:3]
         tgt_mkr_resid = tgt_mkr_data[:,3]
-        tgt_mkr_valid_mask = np.where(np.isclose(tgt_mkr_resid, -1), False, True)
+        tgt_mkr_valid_mask = np.not_equal(tgt_mkr_resid, -1)
         n_tgt_mkr_valid_frs = np.count_nonzero(tgt_mkr_valid_mask)
         if n_tgt_mkr_valid_frs == 0:
-            if log: logger.info(f'Gap filling of "{tgt_mkr_name}" skipped: no valid target marker frame')
+            if log: logger.info('Gap filling of "%s" skipped: no valid target marker frame', tgt_mkr_name)
             return False, n_tgt_mkr_valid_frs
         if n_tgt_mkr_valid_frs == n_total_frs:
-            if log: logger.info(f'Gap filling of "{tgt_mkr_name}" skipped: all target marker frames valid')
+            if log: logger.info('Gap filling of "%s" skipped: all target marker frames valid', tgt_mkr_name)
             return False , n_tgt_mkr_valid_frs   
-        dict_cl_mkr_coords = {}
-        dict_cl_mkr_valid = {}
-        cl_mkr_valid_mask = np.ones((n_total_frs), dtype=bool)
-        for mkr in cl_mkr_names:
-            mkr_data = get_marker_data(itf, mkr, blocked_nan=False, log=log)
+        # (n_total_frs, n_cluster, 3) coordinates and (n_total_frs, n_cluster) validity of all the cluster markers
+        n_cl_mkrs = len(cl_mkr_names)
+        cl_mkr_coords = np.empty((n_total_frs, n_cl_mkrs, 3), dtype=np.float32)
+        cl_mkr_valid = np.empty((n_total_frs, n_cl_mkrs), dtype=bool)
+        for cnt, mkr in enumerate(cl_mkr_names):
+            mkr_data = _get_marker_data_cached(itf, mkr, log=log)
             if mkr_data is None:
                 err_msg = f'Unable to get the information of "{mkr}"'
                 raise ValueError(err_msg)            
-            dict_cl_mkr_coords[mkr] = mkr_data[:,0:3]
-            dict_cl_mkr_valid[mkr] = np.where(np.isclose(mkr_data[:,3], -1), False, True)
-            cl_mkr_valid_mask = np.logical_and(cl_mkr_valid_mask, dict_cl_mkr_valid[mkr])
-        all_mkr_valid_mask = np.logical_and(cl_mkr_valid_mask, tgt_mkr_valid_mask)
+            cl_mkr_coords[:,cnt,:] = mkr_data[:,0:3]
+            np.not_equal(mkr_data[:,3], -1, out=cl_mkr_valid[:,cnt])
+        cl_mkr_valid_mask = np.all(cl_mkr_valid, axis=1)
+        all_mkr_valid_mask = cl_mkr_valid_mask & tgt_mkr_valid_mask
         if not np.any(all_mkr_valid_mask):
-            if log: logger.info(f'Gap filling of "{tgt_mkr_name}" skipped: no common valid frame among markers')
+            if log: logger.info('Gap filling of "%s" skipped: no common valid frame among markers', tgt_mkr_name)
             return False, n_tgt_mkr_valid_frs
-        cl_mkr_only_valid_mask = np.logical_and(cl_mkr_valid_mask, np.logical_not(tgt_mkr_valid_mask))
+        cl_mkr_only_valid_mask = cl_mkr_valid_mask & ~tgt_mkr_valid_mask
         if not np.any(cl_mkr_only_valid_mask):
-            if log: logger.info(f'Gap filling of "{tgt_mkr_name}" skipped: cluster markers not helpful')
+            if log: logger.info('Gap filling of "%s" skipped: cluster markers not helpful', tgt_mkr_name)
             return False, n_tgt_mkr_valid_frs
         all_mkr_valid_frs = np.where(all_mkr_valid_mask)[0]
         cl_mkr_only_valid_frs = np.where(cl_mkr_only_valid_mask)[0]
-        b_updated = False
-        for idx, fr in np.ndenumerate(cl_mkr_only_valid_frs):
-            search_idx = np.searchsorted(all_mkr_valid_frs, fr)
-            if search_idx == 0:
-                fr0 = all_mkr_valid_frs[0]
-                fr1 = all_mkr_valid_frs[1]
-            elif search_idx >= all_mkr_valid_frs.shape[0]:
-                fr0 = all_mkr_valid_frs[all_mkr_valid_frs.shape[0]-2]
-                fr1 = all_mkr_valid_frs[all_mkr_valid_frs.shape[0]-1]
-            else:
-                fr0 = all_mkr_valid_frs[search_idx-1]
-                fr1 = all_mkr_valid_frs[search_idx]
-            if fr <= fr0 or fr >= fr1: continue
-            if ~cl_mkr_valid_mask[fr0] or ~cl_mkr_valid_mask[fr1]: continue
-            if np.any(~cl_mkr_valid_mask[fr0:fr1+1]): continue
-            cl_mkr_coords_fr0 = np.zeros((len(cl_mkr_names), 3), dtype=np.float32)
-            cl_mkr_coords_fr1 = np.zeros((len(cl_mkr_names), 3), dtype=np.float32)
-            cl_mkr_coords_fr = np.zeros((len(cl_mkr_names), 3), dtype=np.float32)
-            for cnt, mkr in enumerate(cl_mkr_names):
-                cl_mkr_coords_fr0[cnt,:] = dict_cl_mkr_coords[mkr][fr0,:]
-                cl_mkr_coords_fr1[cnt,:] = dict_cl_mkr_coords[mkr][fr1,:]
-                cl_mkr_coords_fr[cnt,:] = dict_cl_mkr_coords[mkr][fr,:]
-            rot_fr0, trans_fr0, _, _, _ = RBT(cl_mkr_coords_fr0, cl_mkr_coords_fr)
-            rot_fr1, trans_fr1, _, _, _ = RBT(cl_mkr_coords_fr1, cl_mkr_coords_fr)
-            tgt_mkr_coords_fr_fr0 = np.dot(rot_fr0, tgt_mkr_coords[fr0])+trans_fr0
-            tgt_mkr_coords_fr_fr1 = np.dot(rot_fr1, tgt_mkr_coords[fr1])+trans_fr1
-            tgt_mkr_coords[fr] = (tgt_mkr_coords_fr_fr1-tgt_mkr_coords_fr_fr0)*np.float32(fr-fr0)/np.float32(fr1-fr0)+tgt_mkr_coords_fr_fr0
-            tgt_mkr_resid[fr] = 0.0        
-            b_updated = True        
+        # neighboring common valid frames, clamped to the first or last pair at both ends
+        search_idxs = np.clip(np.searchsorted(all_mkr_valid_frs, cl_mkr_only_valid_frs), 1, all_mkr_valid_frs.shape[0]-1)
+        frs0 = all_mkr_valid_frs[search_idxs-1]
+        frs1 = all_mkr_valid_frs[search_idxs]
+        # keep only the frames strictly inside a pair with no break of the cluster markers in between
+        fill_mask = (cl_mkr_only_valid_frs > frs0) & (cl_mkr_only_valid_frs < frs1)
+        fill_mask &= cl_mkr_valid_mask[frs0] & cl_mkr_valid_mask[frs1]
+        # number of invalid cluster frames before each frame, so that any range [fr0, fr1] is checked in O(1)
+        cl_mkr_invalid_cnts = np.concatenate(([0], np.cumsum(~cl_mkr_valid_mask)))
+        fill_mask &= (cl_mkr_invalid_cnts[frs1+1] == cl_mkr_invalid_cnts[frs0])
+        b_updated = bool(np.any(fill_mask))
         if b_updated:
-            set_marker_pos(itf, tgt_mkr_name, tgt_mkr_coords, None, None, log=log)
-            set_marker_resid(itf, tgt_mkr_name, tgt_mkr_resid, None, None, log=log)
-            n_tgt_mkr_valid_frs_updated = np.count_nonzero(np.where(np.isclose(tgt_mkr_resid, -1), False, True))
-            if log: logger.info(f'Gap filling of "{tgt_mkr_name}" finished')
+            frs = cl_mkr_only_valid_frs[fill_mask]
+            frs0 = frs0[fill_mask]
+            frs1 = frs1[fill_mask]
+            cl_mkr_coords_fr0 = cl_mkr_coords[frs0]
+            cl_mkr_coords_fr1 = cl_mkr_coords[frs1]
+            cl_mkr_coords_fr = cl_mkr_coords[frs]
+            rot_fr0, trans_fr0 = _rbt(cl_mkr_coords_fr0, cl_mkr_coords_fr)
+            rot_fr1, trans_fr1 = _rbt(cl_mkr_coords_fr1, cl_mkr_coords_fr)
+            tgt_mkr_coords_fr_fr0 = np.einsum('ijk,ik->ij', rot_fr0, tgt_mkr_coords[frs0])+trans_fr0
+            tgt_mkr_coords_fr_fr1 = np.einsum('ijk,ik->ij', rot_fr1, tgt_mkr_coords[frs1])+trans_fr1
+            alpha = ((frs-frs0)/(frs1-frs0))[:,None]
+            tgt_mkr_coords[frs] = (tgt_mkr_coords_fr_fr1-tgt_mkr_coords_fr_fr0)*alpha+tgt_mkr_coords_fr_fr0
+            tgt_mkr_resid[frs] = 0.0
+            _write_marker_data(itf, tgt_mkr_name, tgt_mkr_data, log=log)
+            n_tgt_mkr_valid_frs_updated = np.count_nonzero(np.not_equal(tgt_mkr_resid, -1))
+            if log: logger.info('Gap filling of "%s" finished', tgt_mkr_name)
             return True, n_tgt_mkr_valid_frs_updated
         else:
-            if log: logger.info(f'Gap filling of "{tgt_mkr_name}" skipped')
+            if log: logger.info('Gap filling of "%s" skipped', tgt_mkr_name)
             return False, n_tgt_mkr_valid_frs
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
@@ -3849,85 +4499,85 @@ def fill_marker_gap_pattern(itf, tgt_mkr_name, dnr_mkr_name, search_span_offset=
     
     """
     try:
-        if log: logger.debug(f'Start gap filling of "{tgt_mkr_name}" ...')    
+        if log: logger.debug('Start gap filling of "%s" ...', tgt_mkr_name)
         n_total_frs = get_num_frames(itf, log=log)
-        tgt_mkr_data = get_marker_data(itf, tgt_mkr_name, blocked_nan=False, log=log)
+        tgt_mkr_data = _read_marker_data(itf, tgt_mkr_name, log=log)
         if tgt_mkr_data is None:
             err_msg = f'Unable to get the information of "{tgt_mkr_name}"'
             raise ValueError(err_msg)
         tgt_mkr_coords = tgt_mkr_data[:, 0:3]
         tgt_mkr_resid = tgt_mkr_data[:, 3]
-        tgt_mkr_valid_mask = np.where(np.isclose(tgt_mkr_resid, -1), False, True)
+        tgt_mkr_valid_mask = np.not_equal(tgt_mkr_resid, -1)
         n_tgt_mkr_valid_frs = np.count_nonzero(tgt_mkr_valid_mask)
         if n_tgt_mkr_valid_frs == 0:
-            if log: logger.info(f'Gap filling of "{tgt_mkr_name}" skipped: no valid target marker frame')
+            if log: logger.info('Gap filling of "%s" skipped: no valid target marker frame', tgt_mkr_name)
             return False, n_tgt_mkr_valid_frs
         if n_tgt_mkr_valid_frs == n_total_frs:
-            if log: logger.info(f'Gap filling of "{tgt_mkr_name}" skipped: all target marker frames valid')
+            if log: logger.info('Gap filling of "%s" skipped: all target marker frames valid', tgt_mkr_name)
             return False , n_tgt_mkr_valid_frs    
-        dnr_mkr_data = get_marker_data(itf, dnr_mkr_name, blocked_nan=False, log=log)
+        dnr_mkr_data = _get_marker_data_cached(itf, dnr_mkr_name, log=log)
         if dnr_mkr_data is None:
             err_msg = f'Unable to get the information of "{dnr_mkr_name}"'
             raise ValueError(err_msg)        
         dnr_mkr_coords = dnr_mkr_data[:, 0:3]
         dnr_mkr_resid = dnr_mkr_data[:, 3]
-        dnr_mkr_valid_mask = np.where(np.isclose(dnr_mkr_resid, -1), False, True)
+        dnr_mkr_valid_mask = np.not_equal(dnr_mkr_resid, -1)
         if not np.any(dnr_mkr_valid_mask):
-            if log: logger.info(f'Gap filling of "{tgt_mkr_name}" skipped: no valid donor marker frame')
+            if log: logger.info('Gap filling of "%s" skipped: no valid donor marker frame', tgt_mkr_name)
             return False, n_tgt_mkr_valid_frs    
-        both_mkr_valid_mask = np.logical_and(tgt_mkr_valid_mask, dnr_mkr_valid_mask)
+        both_mkr_valid_mask = tgt_mkr_valid_mask & dnr_mkr_valid_mask
         if not np.any(both_mkr_valid_mask):
-            if log: logger.info(f'Gap filling of "{tgt_mkr_name}" skipped: no valid common frame between target and donor markers')
+            if log: logger.info('Gap filling of "%s" skipped: no valid common frame between target and donor markers', tgt_mkr_name)
             return False, n_tgt_mkr_valid_frs        
         tgt_mkr_invalid_frs = np.where(~tgt_mkr_valid_mask)[0]
         tgt_mkr_invalid_gaps = np.split(tgt_mkr_invalid_frs, np.where(np.diff(tgt_mkr_invalid_frs)!=1)[0]+1)
-        b_updated = False
+        dnr_mkr_invalid_cnts = np.concatenate(([0], np.cumsum(~dnr_mkr_valid_mask)))
+        # frames to fill and their neighboring common valid frames, collected over the gaps and filled at once
+        list_frs = []
+        list_frs0 = []
+        list_frs1 = []
         for gap in tgt_mkr_invalid_gaps:
             # Skip if gap size is zero
             if gap.size == 0: continue
+            gap_first_fr = gap[0]
+            gap_last_fr = gap[-1]
             # Skip if gap is either at the first or at the end of the entire frames.
-            if gap.min()==0 or gap.max()==n_total_frs-1: continue
+            if gap_first_fr==0 or gap_last_fr==n_total_frs-1: continue
             search_span = int(np.ceil(gap.size/2))+search_span_offset
             gap_near_tgt_mkr_valid_mask = np.zeros((n_total_frs,), dtype=bool)
-            for i in range(gap.min()-1, gap.min()-1-search_span, -1):
-                if i >= 0: gap_near_tgt_mkr_valid_mask[i]=True
-            for i in range(gap.max()+1, gap.max()+1+search_span, 1):
-                if i < n_total_frs: gap_near_tgt_mkr_valid_mask[i]=True
-            gap_near_tgt_mkr_valid_mask = np.logical_and(gap_near_tgt_mkr_valid_mask, tgt_mkr_valid_mask)
+            gap_near_tgt_mkr_valid_mask[max(gap_first_fr-search_span, 0):gap_first_fr] = True
+            gap_near_tgt_mkr_valid_mask[gap_last_fr+1:gap_last_fr+1+search_span] = True
+            gap_near_tgt_mkr_valid_mask &= tgt_mkr_valid_mask
             # Skip if total number of available target marker frames near the gap within search span is less then minimum required number.
             if np.sum(gap_near_tgt_mkr_valid_mask) < min_needed_frs: continue
             # Skip if there is any invalid frame of the donor marker during the gap period.
-            if np.any(~dnr_mkr_valid_mask[gap]): continue
-            gap_near_both_mkr_valid_mask = np.logical_and(gap_near_tgt_mkr_valid_mask, dnr_mkr_valid_mask)
+            if dnr_mkr_invalid_cnts[gap_last_fr+1] != dnr_mkr_invalid_cnts[gap_first_fr]: continue
+            gap_near_both_mkr_valid_mask = gap_near_tgt_mkr_valid_mask & dnr_mkr_valid_mask
             gap_near_both_mkr_valid_frs = np.where(gap_near_both_mkr_valid_mask)[0]
-            for idx, fr in np.ndenumerate(gap):
-                search_idx = np.searchsorted(gap_near_both_mkr_valid_frs, fr)
-                if search_idx == 0:
-                    fr0 = gap_near_both_mkr_valid_frs[0]
-                    fr1 = gap_near_both_mkr_valid_frs[1]
-                elif search_idx >= gap_near_both_mkr_valid_frs.shape[0]:
-                    fr0 = gap_near_both_mkr_valid_frs[gap_near_both_mkr_valid_frs.shape[0]-2]
-                    fr1 = gap_near_both_mkr_valid_frs[gap_near_both_mkr_valid_frs.shape[0]-1]
-                else:
-                    fr0 = gap_near_both_mkr_valid_frs[search_idx-1]
-                    fr1 = gap_near_both_mkr_valid_frs[search_idx]
-                # Skip if the target marker frame fr is outside of range.
-                if fr <= fr0 or fr >= fr1: continue
-                # Skip if the donor marker is invalid at either fr0 or fr1.
-                if ~dnr_mkr_valid_mask[fr0] or ~dnr_mkr_valid_mask[fr1]: continue
-                v_tgt = (tgt_mkr_coords[fr1]-tgt_mkr_coords[fr0])*np.float32(fr-fr0)/np.float32(fr1-fr0)+tgt_mkr_coords[fr0]
-                v_dnr = (dnr_mkr_coords[fr1]-dnr_mkr_coords[fr0])*np.float32(fr-fr0)/np.float32(fr1-fr0)+dnr_mkr_coords[fr0]
-                tgt_mkr_coords[fr] = v_tgt-v_dnr+dnr_mkr_coords[fr]
-                tgt_mkr_resid[fr] = 0.0
-                b_updated = True
+            search_idxs = np.clip(np.searchsorted(gap_near_both_mkr_valid_frs, gap), 1, gap_near_both_mkr_valid_frs.shape[0]-1)
+            gap_frs0 = gap_near_both_mkr_valid_frs[search_idxs-1]
+            gap_frs1 = gap_near_both_mkr_valid_frs[search_idxs]
+            # Skip the target marker frames outside of range, or where the donor marker is invalid at either fr0 or fr1.
+            gap_fill_mask = (gap > gap_frs0) & (gap < gap_frs1) & dnr_mkr_valid_mask[gap_frs0] & dnr_mkr_valid_mask[gap_frs1]
+            list_frs.append(gap[gap_fill_mask])
+            list_frs0.append(gap_frs0[gap_fill_mask])
+            list_frs1.append(gap_frs1[gap_fill_mask])
+        frs = np.concatenate(list_frs) if list_frs else np.empty((0,), dtype=np.intp)
+        b_updated = frs.size > 0
         if b_updated:
-            set_marker_pos(itf, tgt_mkr_name, tgt_mkr_coords, None, None, log=log)
-            set_marker_resid(itf, tgt_mkr_name, tgt_mkr_resid, None, None, log=log)
-            n_tgt_mkr_valid_frs_updated = np.count_nonzero(np.where(np.isclose(tgt_mkr_resid, -1), False, True))
-            if log: logger.info(f'Gap filling of "{tgt_mkr_name}" finished')
+            frs0 = np.concatenate(list_frs0)
+            frs1 = np.concatenate(list_frs1)
+            alpha = ((frs-frs0)/(frs1-frs0))[:,None]
+            v_tgt = (tgt_mkr_coords[frs1]-tgt_mkr_coords[frs0])*alpha+tgt_mkr_coords[frs0]
+            v_dnr = (dnr_mkr_coords[frs1]-dnr_mkr_coords[frs0])*alpha+dnr_mkr_coords[frs0]
+            tgt_mkr_coords[frs] = v_tgt-v_dnr+dnr_mkr_coords[frs]
+            tgt_mkr_resid[frs] = 0.0
+            _write_marker_data(itf, tgt_mkr_name, tgt_mkr_data, log=log)
+            n_tgt_mkr_valid_frs_updated = np.count_nonzero(np.not_equal(tgt_mkr_resid, -1))
+            if log: logger.info('Gap filling of "%s" finished', tgt_mkr_name)
             return True, n_tgt_mkr_valid_frs_updated
         else:
-            if log: logger.info(f'Gap filling of "{tgt_mkr_name}" skipped')
+            if log: logger.info('Gap filling of "%s" skipped', tgt_mkr_name)
             return False, n_tgt_mkr_valid_frs
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
@@ -3938,7 +4588,7 @@ def fill_marker_gap_pattern(itf, tgt_mkr_name, dnr_mkr_name, search_span_offset=
 
 def fill_marker_gap_interp(itf, tgt_mkr_name, k=3, search_span_offset=5, min_needed_frs=10, log=False):
     """
-    Fill the gaps in a given target marker coordinates using scipy.interpolate.InterpolatedUnivariateSpline function.
+    Fill the gaps in a given target marker coordinates using an interpolating spline from scipy.interpolate.splprep function.
 
     Parameters
     ----------
@@ -3972,58 +4622,53 @@ def fill_marker_gap_interp(itf, tgt_mkr_name, k=3, search_span_offset=5, min_nee
     
     """
     try:
-        if log: logger.debug(f'Start gap filling of "{tgt_mkr_name}" ...')
+        if log: logger.debug('Start gap filling of "%s" ...', tgt_mkr_name)
         n_total_frs = get_num_frames(itf, log=log)
-        tgt_mkr_data = get_marker_data(itf, tgt_mkr_name, blocked_nan=False, log=log)
+        tgt_mkr_data = _read_marker_data(itf, tgt_mkr_name, log=log)
         if tgt_mkr_data is None:
             err_msg = f'Unable to get the information of "{tgt_mkr_name}"'
             raise ValueError(err_msg)        
         tgt_mkr_coords = tgt_mkr_data[:, 0:3]
         tgt_mkr_resid = tgt_mkr_data[:, 3]
-        tgt_mkr_valid_mask = np.where(np.isclose(tgt_mkr_resid, -1), False, True)
+        tgt_mkr_valid_mask = np.not_equal(tgt_mkr_resid, -1)
         n_tgt_mkr_valid_frs = np.count_nonzero(tgt_mkr_valid_mask)    
         if n_tgt_mkr_valid_frs == 0:
-            if log: logger.info(f'Gap filling of "{tgt_mkr_name}" skipped: no valid target marker frame')
+            if log: logger.info('Gap filling of "%s" skipped: no valid target marker frame', tgt_mkr_name)
             return False, n_tgt_mkr_valid_frs
         if n_tgt_mkr_valid_frs == n_total_frs:
-            if log: logger.info(f'Gap filling of "{tgt_mkr_name}" skipped: all target marker frames valid')
+            if log: logger.info('Gap filling of "%s" skipped: all target marker frames valid', tgt_mkr_name)
             return False , n_tgt_mkr_valid_frs     
         b_updated = False
         tgt_mkr_invalid_frs = np.where(~tgt_mkr_valid_mask)[0]
         tgt_mkr_invalid_gaps = np.split(tgt_mkr_invalid_frs, np.where(np.diff(tgt_mkr_invalid_frs)!=1)[0]+1)
         for gap in tgt_mkr_invalid_gaps:
             if gap.size == 0: continue
-            if gap.min()==0 or gap.max()==n_total_frs-1: continue
+            gap_first_fr = gap[0]
+            gap_last_fr = gap[-1]
+            if gap_first_fr==0 or gap_last_fr==n_total_frs-1: continue
             search_span = int(np.ceil(gap.size/2))+search_span_offset
             itpl_cand_frs_mask = np.zeros((n_total_frs,), dtype=bool)
-            for i in range(gap.min()-1, gap.min()-1-search_span, -1):
-                if i>=0: itpl_cand_frs_mask[i]=True
-            for i in range(gap.max()+1, gap.max()+1+search_span, 1):
-                if i<n_total_frs: itpl_cand_frs_mask[i]=True
-            itpl_cand_frs_mask = np.logical_and(itpl_cand_frs_mask, tgt_mkr_valid_mask)
-            if np.sum(itpl_cand_frs_mask) < min_needed_frs: continue
+            itpl_cand_frs_mask[max(gap_first_fr-search_span, 0):gap_first_fr] = True
+            itpl_cand_frs_mask[gap_last_fr+1:gap_last_fr+1+search_span] = True
+            itpl_cand_frs_mask &= tgt_mkr_valid_mask
+            if np.count_nonzero(itpl_cand_frs_mask) < min_needed_frs: continue
             itpl_cand_frs = np.where(itpl_cand_frs_mask)[0]
             itpl_cand_coords = tgt_mkr_coords[itpl_cand_frs, :]
-            fun_itpl_x = InterpolatedUnivariateSpline(itpl_cand_frs, itpl_cand_coords[:,0], k=k, ext='const')
-            fun_itpl_y = InterpolatedUnivariateSpline(itpl_cand_frs, itpl_cand_coords[:,1], k=k, ext='const')
-            fun_itpl_z = InterpolatedUnivariateSpline(itpl_cand_frs, itpl_cand_coords[:,2], k=k, ext='const')
-            itpl_x = fun_itpl_x(gap)
-            itpl_y = fun_itpl_y(gap)
-            itpl_z = fun_itpl_z(gap)
-            for idx, fr in enumerate(gap):
-                tgt_mkr_coords[fr,0] = itpl_x[idx]
-                tgt_mkr_coords[fr,1] = itpl_y[idx]
-                tgt_mkr_coords[fr,2] = itpl_z[idx]
-                tgt_mkr_resid[fr] = 0.0        
+            # Fit x, y, z at once with shared knots; clipping 'gap' gives the same result as ext='const'
+            tck_itpl, _ = splprep(itpl_cand_coords.T, u=itpl_cand_frs, k=k, s=0)
+            itpl_x, itpl_y, itpl_z = splev(np.clip(gap, itpl_cand_frs[0], itpl_cand_frs[-1]), tck_itpl)
+            tgt_mkr_coords[gap,0] = itpl_x
+            tgt_mkr_coords[gap,1] = itpl_y
+            tgt_mkr_coords[gap,2] = itpl_z
+            tgt_mkr_resid[gap] = 0.0
             b_updated = True            
         if b_updated:
-            set_marker_pos(itf, tgt_mkr_name, tgt_mkr_coords, None, None, log=log)
-            set_marker_resid(itf, tgt_mkr_name, tgt_mkr_resid, None, None, log=log)
-            n_tgt_mkr_valid_frs_updated = np.count_nonzero(np.where(np.isclose(tgt_mkr_resid, -1), False, True))
-            if log: logger.info(f'Gap filling of "{tgt_mkr_name}" finished')
+            _write_marker_data(itf, tgt_mkr_name, tgt_mkr_data, log=log)
+            n_tgt_mkr_valid_frs_updated = np.count_nonzero(np.not_equal(tgt_mkr_resid, -1))
+            if log: logger.info('Gap filling of "%s" finished', tgt_mkr_name)
             return True, n_tgt_mkr_valid_frs_updated
         else:
-            if log: logger.info(f'Gap filling of "{tgt_mkr_name}" skipped')
+            if log: logger.info('Gap filling of "%s" skipped', tgt_mkr_name)
             return False, n_tgt_mkr_valid_frs
     except pythoncom.com_error as err:
         if log: logger.error(err.excepinfo[2])
@@ -4032,6 +4677,54 @@ def fill_marker_gap_interp(itf, tgt_mkr_name, k=3, search_span_offset=5, min_nee
         if log: logger.error(err)
         raise
     
+def fill_marker_gaps_linear(mkr_pos, mkr_resid, max_gap=10):
+    """
+    Fill the short gaps of marker coordinates using linear interpolation.
+
+    Parameters
+    ----------
+    mkr_pos : numpy array
+        Marker coordinates, 2D (n, 3) for a single marker or 3D (m, n, 3) for m markers.
+    mkr_resid : numpy array
+        Marker residuals, 1D (n,) for a single marker or 2D (m, n) for m markers. -1 indicates a blocked frame.
+    max_gap : int, optional
+        Maximum number of consecutive blocked frames to be filled. The default is 10.
+
+    Returns
+    -------
+    mkr_pos_filled : numpy array
+        Marker coordinates in the same shape as 'mkr_pos', where the short gaps are filled.
+    mkr_resid_filled : numpy array
+        Marker residuals in the same shape as 'mkr_resid', where the residuals of the filled frames are set as 0.0.
+
+    Notes
+    -----
+    Gaps at the beginning or at the end of the frames are not filled because they have no valid frame on both sides.
+    The input arrays are not modified.
+
+    """
+    mkr_pos = np.asarray(mkr_pos)
+    mkr_resid = np.asarray(mkr_resid)
+    pos = np.array(mkr_pos, dtype=np.result_type(mkr_pos, np.float32), ndmin=3)
+    resid = np.array(mkr_resid, dtype=np.result_type(mkr_resid, np.float32), ndmin=2)
+    if pos.ndim != 3 or pos.shape[2] != 3 or pos.shape[0:2] != resid.shape:
+        err_msg = 'Shapes of "mkr_pos" and "mkr_resid" do not match'
+        raise ValueError(err_msg)
+    n_frs = resid.shape[1]
+    frs = np.arange(n_frs)
+    valid_mask = np.not_equal(resid, -1)
+    prev_valid_frs = np.maximum.accumulate(np.where(valid_mask, frs, -1), axis=1)
+    next_valid_frs = np.minimum.accumulate(np.where(valid_mask, frs, n_frs)[:,::-1], axis=1)[:,::-1]
+    fill_mask = ~valid_mask & (prev_valid_frs >= 0) & (next_valid_frs < n_frs) & (next_valid_frs-prev_valid_frs-1 <= max_gap)
+    if np.any(fill_mask):
+        mkr_idx, fr = np.nonzero(fill_mask)
+        fr0 = prev_valid_frs[mkr_idx, fr]
+        fr1 = next_valid_frs[mkr_idx, fr]
+        alpha = ((fr-fr0)/(fr1-fr0))[:,None]
+        pos[mkr_idx, fr] = pos[mkr_idx, fr0]+alpha*(pos[mkr_idx, fr1]-pos[mkr_idx, fr0])
+        resid[fill_mask] = 0.0
+    return pos.reshape(mkr_pos.shape), resid.reshape(mkr_resid.shape)
+
 def export_trc(itf, f_path, rot_mat=np.eye(3), filt_fc=None, filt_order=2, tgt_mkr_names=None, start_fr=None, end_fr=None, fmt='%.6f', log=False):
     """
     Export a TRC format file, which is compatible with OpenSim for markers.
@@ -4073,7 +4766,7 @@ def export_trc(itf, f_path, rot_mat=np.eye(3), filt_fc=None, filt_order=2, tgt_m
     if end_fr is None:
         end_fr = get_last_frame(itf, log=log)
     n_vid_frs = end_fr-start_fr+1
-    vid_frs = np.linspace(start_fr, end_fr, n_vid_frs, dtype=np.int32)
+    vid_frs = np.arange(start_fr, start_fr+n_vid_frs, dtype=np.int32)
     vid_times = (vid_frs-orig_start_fr)/vid_fps
     orig_vid_frs = get_video_frames(itf, log=log)
     frs_sel_mask = np.logical_and(orig_vid_frs>=vid_frs[0], orig_vid_frs<=vid_frs[-1])
@@ -4093,13 +4786,15 @@ def export_trc(itf, f_path, rot_mat=np.eye(3), filt_fc=None, filt_order=2, tgt_m
     output_data = np.zeros((n_vid_frs, 2+3*len(mkr_names)), dtype=float)
     output_data[:,0] = vid_frs
     output_data[:,1] = vid_times
-    for mkr_idx, mkr_name in enumerate(mkr_names):
-        mkr_pos_raw = np.dot(np.asarray(rot_mat), dict_pts['DATA']['POS'][mkr_name].T).T
+    if len(mkr_names) > 0:
+        # rotate and filter all the marker coordinates as one (n_frames, 3*n_markers) array
+        mkr_pos_raw = np.stack([dict_pts['DATA']['POS'][mkr_name] for mkr_name in mkr_names], axis=1)
+        mkr_pos_raw = np.matmul(mkr_pos_raw, np.asarray(rot_mat).T).reshape(mkr_pos_raw.shape[0], -1)
         if filt_fc is None:
             mkr_pos = mkr_pos_raw
         else:
             mkr_pos = filt_bw_lp(mkr_pos_raw, filt_fc, vid_fps, order=filt_order)
-        output_data[:,2+3*mkr_idx:2+3*mkr_idx+3] = mkr_pos[frs_sel_mask,:]
+        output_data[:,2:] = mkr_pos[frs_sel_mask,:]
     fmt_str = f'%d\t{fmt}\t'+'\t'.join([fmt]*(3*len(mkr_names)))
     np.savetxt(f_path, output_data, fmt=fmt_str, delimiter='\t', comments='', header=hdr_str)
     return None
@@ -4146,7 +4841,7 @@ def export_mot(itf, f_path, rot_mat=np.eye(3), filt_fc=None, filt_order=2, thres
     anal_fps = get_analog_fps(itf, log=log)
     av_ratio = get_analog_video_ratio(itf, log=log)
     n_vid_frs = end_fr-start_fr+1
-    vid_frs = np.linspace(start_fr, end_fr, n_vid_frs, dtype=np.int32)
+    vid_frs = np.arange(start_fr, start_fr+n_vid_frs, dtype=np.int32)
     vid_times = (vid_frs-orig_start_fr)/vid_fps
     first_fr = get_first_frame(itf, log=log)
     last_fr = get_last_frame(itf, log=log)
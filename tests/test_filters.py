@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+from scipy.signal import butter, filtfilt
+
+pytest.importorskip('win32com')
+import pyc3dserver as c3d
+
+
+def test_filt_bw_lp_shape_and_cutoff_forms():
+    x = np.random.default_rng(0).standard_normal((300, 3)).cumsum(axis=0)
+    y = c3d.filt_bw_lp(x, 6.0, 100.0)
+    assert y.shape == x.shape
+    assert np.all(np.isfinite(y))
+    np.testing.assert_array_equal(c3d.filt_bw_lp(x, [6.0], 100.0), y)
+    np.testing.assert_array_equal(c3d.filt_bw_lp(x[:,0], np.float32(6.0), 100.0), c3d.filt_bw_lp(x[:,0], 6.0, 100.0))
+
+
+@pytest.mark.parametrize('name, btype, fcs', [
+    ('filt_bw_lp', 'lowpass', (6.0,)),
+    ('filt_bw_bp', 'bandpass', (3.0, 20.0)),
+    ('filt_bw_bs', 'bandstop', (8.0, 15.0)),
+])
+def test_filt_bw_matches_filtfilt(name, btype, fcs):
+    x = np.random.default_rng(1).standard_normal((300, 4)).cumsum(axis=0)
+    b, a = butter(2, [fc/50.0 for fc in fcs] if len(fcs) > 1 else fcs[0]/50.0, btype=btype)
+    y = getattr(c3d, name)(x, *fcs, 100.0)
+    np.testing.assert_allclose(y, filtfilt(b, a, x, axis=0), rtol=0, atol=1e-9)